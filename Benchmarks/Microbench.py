@@ -0,0 +1,171 @@
+# Import aux libraries
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import numpy as np
+# Import solver modules
+from Solver import Scoring
+from Solver.PatternTable import PatternTable, pattern_match, compute_patterns, data_paths
+from Solver.EntropySolver import EntropySolver
+
+# Default location of stored baseline results
+BASELINE_PATH = os.path.join('Benchmarks', 'baselines.json')
+
+# Candidate set sizes entropy scoring is measured at
+CANDIDATE_SIZES = (2315, 500, 50)
+
+
+def measure(fn, repeat = 5, number = 1):
+    """Times `fn` and returns the median seconds per call.
+
+    Parameters
+    ----------
+    fn : callable
+
+    repeat : int
+        Number of timed samples.
+
+    number : int
+        Calls per sample; raise for sub-millisecond kernels.
+
+    Returns
+    -------
+    seconds : float
+
+    """
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return float(np.median(samples))
+
+
+def run(quick = False, seed = 0):
+    """Runs every microbenchmark.
+
+    Parameters
+    ----------
+    quick : bool
+        Indicate to skip full pattern-table construction (tens of seconds).
+
+    seed : int
+        Seed of the sampled candidate sets.
+
+    Returns
+    -------
+    results : dict
+        Key : benchmark name, value : median seconds per call.
+
+    """
+
+    results = {}
+    rng = np.random.default_rng(seed)
+    # Table load; the table must already be built
+    path = data_paths(5)[2]
+    results['table_load'] = measure(lambda: np.load(path), repeat = 3)
+    table = PatternTable.load()
+    # Single pair pattern matching
+    results['pattern_match'] = measure(lambda: pattern_match('rural', 'larva'), number = 10000)
+    # Full pattern-table construction
+    if not quick:
+        results['table_build'] = measure(lambda: compute_patterns(table.words, table.words), repeat = 1)
+    # Entropy scoring of every guess at several candidate set sizes
+    guess_ids = np.arange(len(table.words))
+    for size in CANDIDATE_SIZES:
+        candidates = np.sort(rng.choice(table.answer_ids, min(size, len(table.answer_ids)), replace = False))
+        results['entropy_scoring_{}'.format(size)] = measure(
+            lambda: Scoring.guess_entropies(table.table, guess_ids, candidates, table.n_patterns), repeat = 3)
+    # State filtering from the full answer set
+    solver = EntropySolver(table)
+    def narrow():
+        solver.reset()
+        solver.apply('soare', 0)
+    results['state_filtering'] = measure(narrow, number = 100)
+    return results
+
+
+def metadata():
+    """Returns a description of the machine results were taken on.
+
+    """
+
+    return {
+        'python' : platform.python_version(),
+        'numpy' : np.__version__,
+        'machine' : platform.machine(),
+        'processor' : platform.processor(),
+        'cpus' : os.cpu_count()
+    }
+
+
+def save(results, path = BASELINE_PATH):
+    """Stores `results` as the baseline.
+
+    """
+
+    with open(path, 'w') as file:
+        json.dump({'metadata' : metadata(), 'results' : results}, file, indent = 2, sort_keys = True)
+        file.write('\n')
+
+
+def compare(results, path = BASELINE_PATH, threshold = 0.2):
+    """Compares `results` against the stored baseline.
+
+    Parameters
+    ----------
+    results : dict
+
+    path : str
+
+    threshold : float
+        Relative slowdown above which a benchmark is flagged; 0.2 flags
+        anything more than 20% slower than baseline.
+
+    Returns
+    -------
+    regressions : dict
+        Key : benchmark name, value : (baseline seconds, current seconds,
+        ratio) of flagged benchmarks.
+
+    """
+
+    with open(path) as file:
+        baseline = json.load(file)
+    if baseline['metadata'] != metadata():
+        print('Warning: baseline taken on a different machine: {}'.format(baseline['metadata']))
+    regressions = {}
+    for name, seconds in sorted(results.items()):
+        if name not in baseline['results']:
+            continue
+        before = baseline['results'][name]
+        ratio = seconds / before
+        flag = ratio > 1 + threshold
+        print('{:<24} {:>12.6f} s {:>12.6f} s {:>7.2f}x {}'.format(name, before, seconds, ratio, 'SLOWER' if flag else ''))
+        if flag:
+            regressions[name] = (before, seconds, ratio)
+    return regressions
+
+
+if __name__ == '__main__':
+    # python -m Benchmarks.Microbench {run,save,compare} [--quick] [--threshold T]
+    parser = argparse.ArgumentParser(description = 'Microbenchmarks of the solver hot kernels.')
+    parser.add_argument('command', choices = ('run', 'save', 'compare'))
+    parser.add_argument('--quick', action = 'store_true', help = 'skip full pattern-table construction')
+    parser.add_argument('--threshold', type = float, default = 0.2, help = 'relative slowdown to flag')
+    parser.add_argument('--baseline', default = BASELINE_PATH)
+    args = parser.parse_args()
+    results = run(args.quick)
+    if args.command == 'run':
+        for name, seconds in sorted(results.items()):
+            print('{:<24} {:>12.6f} s'.format(name, seconds))
+    elif args.command == 'save':
+        save(results, args.baseline)
+        print('Saved baseline to {}'.format(args.baseline))
+    else:
+        sys.exit(1 if compare(results, args.baseline, args.threshold) else 0)
@@ -1,13 +1,21 @@
 # Import packages performing actions on Website
 from abc import abstractmethod
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from webdriver_manager.chrome import ChromeDriverManager
 # Import aux functions
+import os
 import numpy as np
 from numpy import random
-from time import sleep
+# Import instrumentation
+from Solver.Profiler import profiler, sleep
+
+# Site the bots play on;
+#   -> Override with the `WORDLE_URL` environment variable, e.g. to point bots
+#      at the local mock in `Mock/` for offline and CI runs
+WORDLE_URL = 'https://www.nytimes.com/games/wordle/index.html'
 
 class Bot:
 
@@ -25,36 +33,68 @@ class Bot:
   update_game_state(game_tiles)
     Updates game state.
 
+  quit()
+    Closes the Web Driver if the bot started it.
+
   """
 
-  def __init__(self):
+  def __init__(self, headless = False, driver = None):
     """Constructs necessary attributes for a bot to interact and play Wordle.
     
     Creates instance of Chrome Web Driver and initializes word and game state.
 
+    Attributes
+    ----------
+    headless : bool
+      Indicate to run Chrome without a window, e.g. for offline and CI runs 
+      against `Mock/`.
+
+    driver : WebDriver
+      Optional already started Web Driver to play in instead of launching 
+      Chrome; it is left open by `quit()`.
+
     """
     
     # Initialize Chrome Web Driver
-    self.driver = webdriver.Chrome(ChromeDriverManager().install())
+    self.owns_driver = driver is None
+    if driver is None:
+      options = webdriver.ChromeOptions()
+      if headless:
+        options.add_argument('--headless=new')
+        options.add_argument('--window-size=1000,800')
+      driver = webdriver.Chrome(service = Service(ChromeDriverManager().install()), options = options)
+    self.driver = driver
     # Intialize word and game states;
     #   -> word_state : begins with complete space of answers + guesses (?)
     #   -> game_state : begins `True`; game is ON
-    self.word_state = np.loadtxt('Data\\wordle-answers.txt', dtype = str)
+    self.word_state = np.loadtxt(os.path.join('Data', 'wordle-answers.txt'), dtype = str)
     self.game_state = True
+    # Site to play on
+    self.url = os.environ.get('WORDLE_URL', WORDLE_URL)
+
+  def quit(self):
+    """Closes the Web Driver if the bot started it.
+
+    """
+
+    if self.owns_driver:
+      self.driver.quit()
 
   def open_wordle(self):
-      """Navigates Web Driver to NYT Wordle site. 
+      """Navigates Web Driver to NYT Wordle site (or `WORDLE_URL`). 
 
       """
 
       # Navigate Web Driver to NYT Wordle site
       #   -> If Wordle ever moves (as it first did when acquired by NYT); code
       #      will likely break (everywhere; not just here)
-      self.driver.get('https://www.nytimes.com/games/wordle/index.html')
+      with profiler.timer('webdriver'):
+        self.driver.get(self.url)
       sleep(2.5)
       # Click anywhere to minimize intro tab;
-      self.actions = ActionChains(self.driver)
-      self.actions.click().perform()
+      with profiler.timer('webdriver'):
+        self.actions = ActionChains(self.driver)
+        self.actions.click().perform()
       sleep(2.5)
 
   def get_game_tiles(self, idx):
@@ -73,9 +113,10 @@ class Bot:
     """
 
     # Interpret .js gameboard
-    game_app = self.driver.find_element(By.TAG_NAME , 'game-app')
-    game_rows = self.driver.execute_script("return arguments[0].shadowRoot.getElementById('board')", game_app).find_elements(By.TAG_NAME, 'game-row')
-    game_tiles = self.driver.execute_script('return arguments[0].shadowRoot', game_rows[idx]).find_elements(By.CSS_SELECTOR , 'game-tile')
+    with profiler.timer('webdriver'):
+      game_app = self.driver.find_element(By.TAG_NAME , 'game-app')
+      game_rows = self.driver.execute_script("return arguments[0].shadowRoot.getElementById('board')", game_app).find_elements(By.TAG_NAME, 'game-row')
+      game_tiles = self.driver.execute_script('return arguments[0].shadowRoot', game_rows[idx]).find_elements(By.CSS_SELECTOR , 'game-tile')
     return game_tiles
 
   def update_game_state(self, game_tiles):
@@ -95,7 +136,8 @@ class Bot:
     # Interpret attempt:
     #   -> Each 'evaluation' attribute takes on one of three values: 
     #      {'correct', 'present', 'absent'}
-    evals = [tile.get_attribute('evaluation') for tile in game_tiles]
+    with profiler.timer('webdriver'):
+      evals = [tile.get_attribute('evaluation') for tile in game_tiles]
     # Game state;
     #   -> Game ends iff all tags are correct
     #      (given six attempts have not been exhausted)
@@ -5,9 +5,10 @@ from selenium.webdriver.common.action_chains import ActionChains
 # Import aux functions
 import numpy as np
 from numpy import random
-from time import sleep
 # Import parent class
 from Bots.Bot import Bot
+# Import instrumentation
+from Solver.Profiler import profiler, sleep
 
 class RandomBot(Bot):
 
@@ -37,9 +38,10 @@ class RandomBot(Bot):
         print(' ')
         print('-'*80)
         # Play guess on gameboard
-        self.actions.send_keys(guess)
-        self.actions.send_keys(Keys.RETURN)
-        self.actions.perform()
+        with profiler.timer('webdriver'):
+            self.actions.send_keys(guess)
+            self.actions.send_keys(Keys.RETURN)
+            self.actions.perform()
 
     def evaluate_guess(self, idx):
         """Evaluates the quality of guess at time step `idx` through simple 
@@ -72,9 +74,11 @@ class RandomBot(Bot):
         """
 
         # Interpret gameboard
-        game_app = self.driver.find_element(By.TAG_NAME , 'game-app')
-        game_rows = self.driver.execute_script("return arguments[0].shadowRoot.getElementById('board')", game_app).find_elements(By.TAG_NAME, 'game-row')
-        letters = self.driver.execute_script('return arguments[0].shadowRoot', game_rows[idx]).find_elements(By.CSS_SELECTOR , 'game-tile')
+        with profiler.timer('webdriver'):
+            game_app = self.driver.find_element(By.TAG_NAME , 'game-app')
+            game_rows = self.driver.execute_script("return arguments[0].shadowRoot.getElementById('board')", game_app).find_elements(By.TAG_NAME, 'game-row')
+            letters = self.driver.execute_script('return arguments[0].shadowRoot', game_rows[idx]).find_elements(By.CSS_SELECTOR , 'game-tile')
+            evaluations = [letter.get_attribute('evaluation') for letter in letters]
 
         # Quantize evaluation 
         eval_to_int = {
@@ -85,8 +89,8 @@ class RandomBot(Bot):
 
         # Evaluate guess
         correctness = 0
-        for letter in letters:
-            correctness += eval_to_int[letter.get_attribute('evaluation')]
+        for evaluation in evaluations:
+            correctness += eval_to_int[evaluation]
         correctness /= 10
         print('Correctness: {:.2f}'.format(correctness))
 
@@ -126,3 +130,5 @@ class RandomBot(Bot):
         self.actions.perform()
         # Close Web Driver after 15 seconds;
         sleep(15)
+        # Close game record of instrumentation; includes the closing wait
+        profiler.end_game()
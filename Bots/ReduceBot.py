@@ -4,9 +4,10 @@ from selenium.webdriver.common.action_chains import ActionChains
 # Import aux functions
 import numpy as np
 from numpy import random
-from time import sleep
 # Parent class
 from Bots.Bot import Bot  
+# Import instrumentation
+from Solver.Profiler import profiler, sleep
 
 class ReduceBot(Bot):
   
@@ -40,9 +41,10 @@ class ReduceBot(Bot):
     bool_mask = self.word_state != guess
     print('Guess: ', guess)
     # Play guess on gameboard
-    self.actions.send_keys(guess)
-    self.actions.send_keys(Keys.RETURN)
-    self.actions.perform()
+    with profiler.timer('webdriver'):
+      self.actions.send_keys(guess)
+      self.actions.send_keys(Keys.RETURN)
+      self.actions.perform()
     # Remove from word state the just played word
     self.word_state = self.word_state[bool_mask]
 
@@ -65,73 +67,73 @@ class ReduceBot(Bot):
 
     # Print current state size
     print('Current word state size: {}'.format(self.word_state.size))
-    # Initialize lists for correct, present, absent
-    #   -> Elements of each are sublists
-    correct = []
-    present = []
-    absent = []
-    # First pass; append CORRECT and PRESENT letters;
-    #   -> This helps with resolving issues of REPEAT letters
-    # Intialize running list to track PRESENT and CORRECT letters;
-    correct_present = []
-    for tile in game_tiles:
-      letter = tile.get_attribute('letter')
-      eval = tile.get_attribute('evaluation')
-      if (eval == 'correct') or (eval == 'present'):
-        correct_present.append(letter)
-    # Second pass; update search space
-    for i, tile in enumerate(game_tiles):
-      letter = tile.get_attribute('letter')
-      eval = tile.get_attribute('evaluation')
-      # Letter is present and at exact position in answer
-      if eval == 'correct':
-        # Add words to new state with letter at POSITION `i` in word;
-        #   -> This requires later filtering; 
-        #      E.g: multiple correct letters at multiple positions
-        #         ('t' @ idx 0) : ['train', 'tank', ... ] 
-        #         ('r' @ idx 1) : ['train', 'brain', ... ]
-        #   -> correct : ['train']
-        #   -> needs to satsify all 'CORRECT' tags
-        correct.append([word for word in self.word_state if word[i] == letter])
-      # Letter is present in answer
-      elif eval == 'present':
-        # Add words to new state WITH LETTER in word
-        #   -> This requires further filtering; 
-        #      E.g: multiple present letters
-        #         ('a') : ['apple', 'tank', 'alone' ] 
-        #         ('e') : ['apple', 'prey', 'alone ]
-        #   -> present : ['apple', 'alone']
-        #   -> needs to satsify all 'PRESENT' tags
-        present.append([word for word in self.word_state if letter in word])
-      # Letter is not present in answer
-      else:
-        # Add words to new state WITHOUT LETTER in word
-        #   -> Note: only the first PRESENT letter is marked; the second is marked ABSENT
-        #   -> Resolve: maintain list of PRESENT letters; add condition 
-        #   -> Issue : if repeat letter is before a CORRECT letter; it is marked ABSENT
-        #   -> Resolve: maintain list of CORRECT letters
-        # Add iff letter is correct/present already (REPEAT case handling)
-        if letter not in correct_present:
-          absent.append([word for word in self.word_state if letter not in word ])
-    # Filter lists; each list is sublist satsifying different letter properties
-    #   -> For each list, we intersect and find common between each sublist
-    #   -> Note: Can not use set.intersection() method on empty list
-    #   -> Note: It is possible that set.intersection() itself returns an empty list
-    sets = [correct, present, absent]
-    for i in np.arange(len(sets)):
-      subset = sets[i]
-      # Perform intersection method if list is non empty
-      if subset:
-        # Find intersection of sub list 
-        sets[i] = list(set.intersection(*map(set, subset)))
-    correct, present, absent = tuple(sets)
-    # New word state is the INTERSECTION of three lists: (correct ∩ present ∩ absent)
-    #   -> Note: if either sets - correct, present, or absent are EMPTY;
-    #            the intersection including an EMPTY list is also EMPTY
-    #   -> Resolve: check for non-emptiness again and intersect on non-empty subsets
-    sets = [subset for subset in [correct, present, absent] if subset]
-    new_state = np.array(list(set.intersection(*map(set, sets))))
-    self.word_state = new_state
+    # Read attempt off the gameboard
+    with profiler.timer('webdriver'):
+      tiles = [(tile.get_attribute('letter'), tile.get_attribute('evaluation')) for tile in game_tiles]
+    with profiler.timer('state_filtering'):
+      # Initialize lists for correct, present, absent
+      #   -> Elements of each are sublists
+      correct = []
+      present = []
+      absent = []
+      # First pass; append CORRECT and PRESENT letters;
+      #   -> This helps with resolving issues of REPEAT letters
+      # Intialize running list to track PRESENT and CORRECT letters;
+      correct_present = []
+      for letter, eval in tiles:
+        if (eval == 'correct') or (eval == 'present'):
+          correct_present.append(letter)
+      # Second pass; update search space
+      for i, (letter, eval) in enumerate(tiles):
+        # Letter is present and at exact position in answer
+        if eval == 'correct':
+          # Add words to new state with letter at POSITION `i` in word;
+          #   -> This requires later filtering; 
+          #      E.g: multiple correct letters at multiple positions
+          #         ('t' @ idx 0) : ['train', 'tank', ... ] 
+          #         ('r' @ idx 1) : ['train', 'brain', ... ]
+          #   -> correct : ['train']
+          #   -> needs to satsify all 'CORRECT' tags
+          correct.append([word for word in self.word_state if word[i] == letter])
+        # Letter is present in answer
+        elif eval == 'present':
+          # Add words to new state WITH LETTER in word
+          #   -> This requires further filtering; 
+          #      E.g: multiple present letters
+          #         ('a') : ['apple', 'tank', 'alone' ] 
+          #         ('e') : ['apple', 'prey', 'alone ]
+          #   -> present : ['apple', 'alone']
+          #   -> needs to satsify all 'PRESENT' tags
+          present.append([word for word in self.word_state if letter in word])
+        # Letter is not present in answer
+        else:
+          # Add words to new state WITHOUT LETTER in word
+          #   -> Note: only the first PRESENT letter is marked; the second is marked ABSENT
+          #   -> Resolve: maintain list of PRESENT letters; add condition 
+          #   -> Issue : if repeat letter is before a CORRECT letter; it is marked ABSENT
+          #   -> Resolve: maintain list of CORRECT letters
+          # Add iff letter is correct/present already (REPEAT case handling)
+          if letter not in correct_present:
+            absent.append([word for word in self.word_state if letter not in word ])
+      # Filter lists; each list is sublist satsifying different letter properties
+      #   -> For each list, we intersect and find common between each sublist
+      #   -> Note: Can not use set.intersection() method on empty list
+      #   -> Note: It is possible that set.intersection() itself returns an empty list
+      sets = [correct, present, absent]
+      for i in np.arange(len(sets)):
+        subset = sets[i]
+        # Perform intersection method if list is non empty
+        if subset:
+          # Find intersection of sub list 
+          sets[i] = list(set.intersection(*map(set, subset)))
+      correct, present, absent = tuple(sets)
+      # New word state is the INTERSECTION of three lists: (correct ∩ present ∩ absent)
+      #   -> Note: if either sets - correct, present, or absent are EMPTY;
+      #            the intersection including an EMPTY list is also EMPTY
+      #   -> Resolve: check for non-emptiness again and intersect on non-empty subsets
+      sets = [subset for subset in [correct, present, absent] if subset]
+      new_state = np.array(list(set.intersection(*map(set, sets))))
+      self.word_state = new_state
     print('New word state size: {}'.format(new_state.size))
     print('-'*80)
 
@@ -200,3 +202,5 @@ class ReduceBot(Bot):
     self.actions.perform()
     # Close Web Driver after 15 seconds;
     sleep(15)
+    # Close game record of instrumentation; includes the closing wait
+    profiler.end_game()
@@ -2,13 +2,14 @@
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 # Import aux libraries
-import pickle
 import numpy as np
 from numpy import random
-from time import sleep
 from wordfreq import zipf_frequency
 # Parent class
 from Bots.Bot import Bot
+# Import instrumentation
+from Solver.Profiler import profiler, sleep
+from Solver import Artifacts
 
 class ZipfBot(Bot):
 
@@ -34,7 +35,7 @@ class ZipfBot(Bot):
     
     """
 
-    def __init__(self, compute = False, save = False):
+    def __init__(self, compute = False, save = False, headless = False, driver = None):
         """Constructs additional attributes for bot to play Wordle using simple
         word-ranking with word-frequencies.
 
@@ -45,18 +46,24 @@ class ZipfBot(Bot):
 
         save : bool
             Indicate to save computed Zipf dictionary to file.
+
+        headless : bool
+            Indicate to run Chrome without a window; see `Bot`.
+
+        driver : WebDriver
+            Optional already started Web Driver; see `Bot`.
         
         """
-        super(ZipfBot, self).__init__()
+        super(ZipfBot, self).__init__(headless, driver)
 
         if compute:
             self.zipf_dict = self.__create_zipf_dict()
             if save:
-                with open('Data\\zipf_dict.pkl', 'wb') as dict:
-                    pickle.dump(self.zipf_dict, dict)
+                # Written atomically with a stamp of the answer list
+                Artifacts.save_zipf_dict(self.zipf_dict)
         else:
-            with open('Data\\zipf_dict.pkl', 'rb') as dict:
-                self.zipf_dict = pickle.load(dict)
+            # Raises `StaleArtifactError` if answer list has changed
+            self.zipf_dict = Artifacts.load_zipf_dict()
 
     def __create_zipf_dict(self):
         """Computes Zipf frequency of each word in initial word state.
@@ -95,9 +102,10 @@ class ZipfBot(Bot):
         guess = self.word_state[guess_idx]
         print('Guess: ', guess)
         # Play guess on gameboard
-        self.actions.send_keys(guess)
-        self.actions.send_keys(Keys.RETURN)
-        self.actions.perform()
+        with profiler.timer('webdriver'):
+            self.actions.send_keys(guess)
+            self.actions.send_keys(Keys.RETURN)
+            self.actions.perform()
 
     def __make_guess(self):
         """Generates a greedy guess from current word state by considering 
@@ -113,9 +121,10 @@ class ZipfBot(Bot):
         print('Guess: ', guess)
         print('Zipf score: {}'.format(self.zipf_dict[guess]))
         # Play guess on gameboard
-        self.actions.send_keys(guess)
-        self.actions.send_keys(Keys.RETURN)
-        self.actions.perform()
+        with profiler.timer('webdriver'):
+            self.actions.send_keys(guess)
+            self.actions.send_keys(Keys.RETURN)
+            self.actions.perform()
         # Remove from word state the just played word
         self.word_state = self.word_state[bool_mask]
 
@@ -138,73 +147,73 @@ class ZipfBot(Bot):
 
         # Print current state size
         print('Current word state size: {}'.format(self.word_state.size))
-        # Initialize lists for correct, present, absent
-        #   -> Elements of each are sublists
-        correct = []
-        present = []
-        absent = []
-        # First pass; append CORRECT and PRESENT letters;
-        #   -> This helps with resolving issues of REPEAT letters
-        # Intialize running list to track PRESENT and CORRECT letters;
-        correct_present = []
-        for tile in game_tiles:
-            letter = tile.get_attribute('letter')
-            eval = tile.get_attribute('evaluation')
-            if (eval == 'correct') or (eval == 'present'):
-                correct_present.append(letter)
-        # Second pass; update search space
-        for i, tile in enumerate(game_tiles):
-            letter = tile.get_attribute('letter')
-            eval = tile.get_attribute('evaluation')
-            # Letter is present and at exact position in answer
-            if eval == 'correct':
-                # Add words to new state with letter at POSITION `i` in word;
-                #   -> This requires later filtering; 
-                #      E.g: multiple correct letters at multiple positions
-                #         ('t' @ idx 0) : ['train', 'tank', ... ] 
-                #         ('r' @ idx 1) : ['train', 'brain', ... ]
-                #   -> correct : ['train']
-                #   -> needs to satsify all 'CORRECT' tags
-                correct.append([word for word in self.word_state if word[i] == letter])
-            # Letter is present in answer
-            elif eval == 'present':
-                # Add words to new state WITH LETTER in word
-                #   -> This requires further filtering; 
-                #      E.g: multiple present letters
-                #         ('a') : ['apple', 'tank', 'alone' ] 
-                #         ('e') : ['apple', 'prey', 'alone ]
-                #   -> present : ['apple', 'alone']
-                #   -> needs to satsify all 'PRESENT' tags
-                present.append([word for word in self.word_state if letter in word])
-            # Letter is not present in answer
-            else:
-                # Add words to new state WITHOUT LETTER in word
-                #   -> Note: only the first PRESENT letter is marked; the second is marked ABSENT
-                #   -> Resolve: maintain list of PRESENT letters; add condition 
-                #   -> Issue : if repeat letter is before a CORRECT letter; it is marked ABSENT
-                #   -> Resolve: maintain list of CORRECT letters
-                # Add iff letter is correct/present already (REPEAT case handling)
-                if letter not in correct_present:
-                    absent.append([word for word in self.word_state if letter not in word ])
-        # Filter lists; each list is sublist satsifying different letter properties
-        #   -> For each list, we intersect and find common between each sublist
-        #   -> Note: Can not use set.intersection() method on empty list
-        #   -> Note: It is possible that set.intersection() itself returns an empty list
-        sets = [correct, present, absent]
-        for i in np.arange(len(sets)):
-            subset = sets[i]
-            # Perform intersection method if list is non empty
-            if subset:
-                # Find intersection of sub list 
-                sets[i] = list(set.intersection(*map(set, subset)))
-        correct, present, absent = tuple(sets)
-        # New word state is the INTERSECTION of three lists: (correct ∩ present ∩ absent)
-        #   -> Note: if either sets - correct, present, or absent are EMPTY;
-        #            the intersection including an EMPTY list is also EMPTY
-        #   -> Resolve: check for non-emptiness again and intersect on non-empty subsets
-        sets = [subset for subset in [correct, present, absent] if subset]
-        new_state = np.array(list(set.intersection(*map(set, sets))))
-        self.word_state = new_state
+        # Read attempt off the gameboard
+        with profiler.timer('webdriver'):
+            tiles = [(tile.get_attribute('letter'), tile.get_attribute('evaluation')) for tile in game_tiles]
+        with profiler.timer('state_filtering'):
+            # Initialize lists for correct, present, absent
+            #   -> Elements of each are sublists
+            correct = []
+            present = []
+            absent = []
+            # First pass; append CORRECT and PRESENT letters;
+            #   -> This helps with resolving issues of REPEAT letters
+            # Intialize running list to track PRESENT and CORRECT letters;
+            correct_present = []
+            for letter, eval in tiles:
+                if (eval == 'correct') or (eval == 'present'):
+                    correct_present.append(letter)
+            # Second pass; update search space
+            for i, (letter, eval) in enumerate(tiles):
+                # Letter is present and at exact position in answer
+                if eval == 'correct':
+                    # Add words to new state with letter at POSITION `i` in word;
+                    #   -> This requires later filtering; 
+                    #      E.g: multiple correct letters at multiple positions
+                    #         ('t' @ idx 0) : ['train', 'tank', ... ] 
+                    #         ('r' @ idx 1) : ['train', 'brain', ... ]
+                    #   -> correct : ['train']
+                    #   -> needs to satsify all 'CORRECT' tags
+                    correct.append([word for word in self.word_state if word[i] == letter])
+                # Letter is present in answer
+                elif eval == 'present':
+                    # Add words to new state WITH LETTER in word
+                    #   -> This requires further filtering; 
+                    #      E.g: multiple present letters
+                    #         ('a') : ['apple', 'tank', 'alone' ] 
+                    #         ('e') : ['apple', 'prey', 'alone ]
+                    #   -> present : ['apple', 'alone']
+                    #   -> needs to satsify all 'PRESENT' tags
+                    present.append([word for word in self.word_state if letter in word])
+                # Letter is not present in answer
+                else:
+                    # Add words to new state WITHOUT LETTER in word
+                    #   -> Note: only the first PRESENT letter is marked; the second is marked ABSENT
+                    #   -> Resolve: maintain list of PRESENT letters; add condition 
+                    #   -> Issue : if repeat letter is before a CORRECT letter; it is marked ABSENT
+                    #   -> Resolve: maintain list of CORRECT letters
+                    # Add iff letter is correct/present already (REPEAT case handling)
+                    if letter not in correct_present:
+                        absent.append([word for word in self.word_state if letter not in word ])
+            # Filter lists; each list is sublist satsifying different letter properties
+            #   -> For each list, we intersect and find common between each sublist
+            #   -> Note: Can not use set.intersection() method on empty list
+            #   -> Note: It is possible that set.intersection() itself returns an empty list
+            sets = [correct, present, absent]
+            for i in np.arange(len(sets)):
+                subset = sets[i]
+                # Perform intersection method if list is non empty
+                if subset:
+                    # Find intersection of sub list 
+                    sets[i] = list(set.intersection(*map(set, subset)))
+            correct, present, absent = tuple(sets)
+            # New word state is the INTERSECTION of three lists: (correct ∩ present ∩ absent)
+            #   -> Note: if either sets - correct, present, or absent are EMPTY;
+            #            the intersection including an EMPTY list is also EMPTY
+            #   -> Resolve: check for non-emptiness again and intersect on non-empty subsets
+            sets = [subset for subset in [correct, present, absent] if subset]
+            new_state = np.array(list(set.intersection(*map(set, sets))))
+            self.word_state = new_state
         print('New word state size: {}'.format(new_state.size))
         print('-'*80)
         # Update state of `zipf_dict`
@@ -255,4 +264,6 @@ class ZipfBot(Bot):
         self.actions.click()
         self.actions.perform()
         # Close Web Driver after 15 seconds;
-        sleep(15)
\ No newline at end of file
+        sleep(15)
+        # Close game record of instrumentation; includes the closing wait
+        profiler.end_game()
@@ -0,0 +1,122 @@
+# Import aux libraries
+import os
+import argparse
+import importlib
+import threading
+import numpy as np
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+# Import instrumentation
+from Solver.Profiler import profiler
+
+# Directory holding the mock page
+MOCK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+
+    """Static file handler without per-request logging.
+
+    """
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(port = 8000, directory = MOCK_DIR):
+    """Serves the mock page from a background thread on localhost.
+
+    Parameters
+    ----------
+    port : int
+        Port to listen on; 0 picks a free port.
+
+    directory : str
+
+    Returns
+    -------
+    server : ThreadingHTTPServer
+        Call `shutdown()` to stop serving.
+
+    """
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), partial(QuietHandler, directory = directory))
+    threading.Thread(target = server.serve_forever, daemon = True).start()
+    return server
+
+
+def mock_url(server, answer = 'cigar', delay = 1500):
+    """Returns the URL of the mock page for a given answer and reveal delay.
+
+    """
+
+    return 'http://127.0.0.1:{}/index.html?answer={}&delay={}'.format(server.server_address[1], answer, delay)
+
+
+def benchmark(bot_name, server, answers, delay = 1500, **kwargs):
+    """Plays one browser game of `bot_name` per answer against the mock page
+    with instrumentation enabled.
+
+    Parameters
+    ----------
+    bot_name : str
+        Bot class in `Bots`, e.g. 'EntropyBot'.
+
+    server : ThreadingHTTPServer
+
+    answers : iterable
+
+    delay : int
+        Reveal delay in milliseconds.
+
+    **kwargs
+        Passed to the bot constructor, e.g. `headless = True` for CI or
+        `driver` to reuse a started Web Driver.
+
+    Returns
+    -------
+    report : dict
+        Per-game and aggregate profiler report.
+
+    """
+
+    bot_class = getattr(importlib.import_module('Bots.{}'.format(bot_name)), bot_name)
+    profiler.reset()
+    profiler.enable()
+    for answer in answers:
+        os.environ['WORDLE_URL'] = mock_url(server, answer, delay)
+        bot = bot_class(**kwargs)
+        try:
+            bot.play_wordle()
+        finally:
+            bot.quit()
+    profiler.disable()
+    return profiler.report()
+
+
+if __name__ == '__main__':
+    # python -m Mock.serve [--port P] [--answer A] [--delay D] [--bot B --games N [--headless]]
+    parser = argparse.ArgumentParser(description = 'Serve the mock Wordle page on localhost.')
+    parser.add_argument('--port', type = int, default = 8000)
+    parser.add_argument('--answer', default = None, help = 'secret answer; random per game when omitted')
+    parser.add_argument('--delay', type = int, default = 1500, help = 'reveal delay in milliseconds')
+    parser.add_argument('--bot', default = None, help = 'bot class to benchmark, e.g. EntropyBot')
+    parser.add_argument('--games', type = int, default = 1)
+    parser.add_argument('--seed', type = int, default = 0)
+    parser.add_argument('--headless', action = 'store_true', help = 'run Chrome without a window')
+    args = parser.parse_args()
+    server = serve(args.port)
+    if args.bot is None:
+        print('Serving {}'.format(mock_url(server, args.answer or 'cigar', args.delay)))
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+    else:
+        if args.answer:
+            answers = [args.answer] * args.games
+        else:
+            answers = np.random.default_rng(args.seed).choice(np.loadtxt(os.path.join('Data', 'wordle-answers.txt'), dtype = str), args.games)
+        benchmark(args.bot, server, answers, args.delay, headless = args.headless)
+        print(profiler.to_json(indent = 2))
+        server.shutdown()
@@ -3,10 +3,17 @@ from Bots.RandomBot import RandomBot
 from Bots.ReduceBot import ReduceBot
 from Bots.ZipfBot import ZipfBot
 from Bots.EntropyBot import EntropyBot
+# Import precomputed artifact manager
+from Solver import Artifacts
 
 if __name__ == '__main__':
     # Replace bot class with desired bot (default Zipf)
     #   -> Check source code for constructor arguments (ZipfBot, EntropyBot)
     #      where computations are required for first runs
+    #   -> EntropyBot(hard_mode = True) restricts guesses to those consistent
+    #      with all revealed hints
+    # Rebuild missing or stale precomputed tables before play
+    #   -> Add 'zipf_dict' when playing with ZipfBot
+    Artifacts.ensure(('pattern_table', 'partition_index'))
     bot = EntropyBot()
     bot.play_wordle()
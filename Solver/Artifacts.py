@@ -0,0 +1,369 @@
+# Import aux libraries
+import os
+import sys
+import json
+import hashlib
+import pickle
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# Format version of each precomputed artifact;
+#   -> Bump when the layout of an artifact changes so existing files are
+#      treated as stale
+FORMAT_VERSIONS = {
+    'pattern_table' : 1,
+    'partition_index' : 1,
+    'zipf_dict' : 1,
+    'endgame_cache' : 1
+}
+
+# Artifacts managed by `ensure`, each with those that must be built before it
+#   -> The endgame cache is left out; it is filled at runtime rather than
+#      built, and is only stamped so stale caches are discarded on load
+DEPENDENCIES = {
+    'pattern_table' : (),
+    'partition_index' : ('pattern_table',),
+    'zipf_dict' : ()
+}
+
+# Default location of the Zipf dictionary
+ZIPF_PATH = os.path.join('Data', 'zipf_dict.pkl')
+
+
+class StaleArtifactError(Exception):
+
+    """Raised when a precomputed artifact is missing or was built from
+    different word lists, word length or format version.
+
+    """
+
+
+def length_path(path, length):
+    """Returns `path` suffixed by word length for lengths other than five.
+
+        length_path('Data/pattern_table.npy', 6)
+        >>> 'Data/pattern_table-6.npy'
+
+    """
+
+    if length == 5:
+        return path
+    root, ext = os.path.splitext(path)
+    return '{}-{}{}'.format(root, length, ext)
+
+
+def stamp(name, words, answer_ids, length):
+    """Returns the stamp an artifact built from the given word lists carries.
+
+    Parameters
+    ----------
+    name : str
+        Artifact name; a key of `FORMAT_VERSIONS`.
+
+    words : np.ndarray
+        Vocabulary the artifact is built over.
+
+    answer_ids : np.ndarray
+        Indices into `words` of the answers.
+
+    length : int
+
+    Returns
+    -------
+    stamp : dict
+
+    """
+
+    digest = hashlib.sha256()
+    digest.update('\n'.join(words).encode())
+    digest.update(b'\0')
+    digest.update(np.asarray(answer_ids, dtype = np.int64).tobytes())
+    return {
+        'artifact' : name,
+        'format' : FORMAT_VERSIONS[name],
+        'length' : int(length),
+        'words' : digest.hexdigest()
+    }
+
+
+def stamp_path(path):
+    return path + '.stamp'
+
+
+def read_stamp(path):
+    """Returns the stamp saved alongside `path`; `None` when missing.
+
+    """
+
+    try:
+        with open(stamp_path(path)) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def check(paths, expected):
+    """Returns why the artifact at `paths` does not match `expected`; `None`
+    when it is fresh.
+
+    Parameters
+    ----------
+    paths : list
+        Files making up the artifact; the stamp sits next to the first.
+
+    expected : dict
+        Stamp the artifact should carry.
+
+    Returns
+    -------
+    reason : str
+
+    """
+
+    for path in paths:
+        if not os.path.exists(path):
+            return 'missing {}'.format(path)
+    found = read_stamp(paths[0])
+    if found is None:
+        return 'unstamped {}'.format(paths[0])
+    if found != expected:
+        return 'stale {} (stamp {}, expected {})'.format(paths[0], found, expected)
+    return None
+
+
+def validate(paths, expected):
+    """Raises `StaleArtifactError` unless the artifact at `paths` matches
+    `expected`.
+
+    """
+
+    reason = check(paths, expected)
+    if reason is not None:
+        raise StaleArtifactError('{}; rebuild with `python -m Solver.Artifacts`'.format(reason))
+
+
+def atomic_write(path, write):
+    """Writes a file atomically.
+
+    Data is written to a temporary file in the same directory, flushed to
+    disk and moved over `path`, so readers only ever see the old or the new
+    complete file.
+
+    Parameters
+    ----------
+    path : str
+
+    write : callable
+        Called with the open (binary) temporary file.
+
+    Returns
+    -------
+    None
+
+    """
+
+    temp = '{}.tmp-{}'.format(path, os.getpid())
+    try:
+        with open(temp, 'wb') as file:
+            write(file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp, path)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+
+def save(writers, expected):
+    """Atomically writes an artifact and then its stamp.
+
+    The old stamp is removed first, so an interrupted save leaves the
+    artifact unstamped (and thus stale) rather than mismatched.
+
+    Parameters
+    ----------
+    writers : list
+        (path, write) pairs; see `atomic_write`. The stamp sits next to the
+        first path.
+
+    expected : dict
+        Stamp of the artifact.
+
+    Returns
+    -------
+    None
+
+    """
+
+    first = writers[0][0]
+    if os.path.exists(stamp_path(first)):
+        os.remove(stamp_path(first))
+    for path, write in writers:
+        atomic_write(path, write)
+    atomic_write(stamp_path(first), lambda file: file.write(json.dumps(expected).encode()))
+
+
+def save_array(path, array):
+    """Returns a (path, write) pair saving `array` as '.npy'.
+
+    """
+
+    return path, lambda file: np.save(file, array)
+
+
+def save_pickle(path, obj):
+    """Returns a (path, write) pair pickling `obj`.
+
+    """
+
+    return path, lambda file: pickle.dump(obj, file)
+
+
+def zipf_words():
+    """Returns the answer list the Zipf dictionary is built over.
+
+    """
+
+    from Solver.PatternTable import data_paths
+    return np.loadtxt(data_paths(5)[0], dtype = str)
+
+
+def load_zipf_dict(path = ZIPF_PATH):
+    """Loads the validated Zipf dictionary.
+
+    """
+
+    words = zipf_words()
+    validate([path], stamp('zipf_dict', words, np.arange(len(words)), 5))
+    with open(path, 'rb') as file:
+        return pickle.load(file)
+
+
+def save_zipf_dict(zipf_dict, path = ZIPF_PATH):
+    """Saves a Zipf dictionary atomically with its stamp.
+
+    """
+
+    words = zipf_words()
+    save([save_pickle(path, zipf_dict)], stamp('zipf_dict', words, np.arange(len(words)), 5))
+
+
+def build_zipf_dict(path = ZIPF_PATH):
+    """Computes and saves the Zipf frequency of every answer.
+
+    """
+
+    # Optional dependency; only needed when (re)building
+    from wordfreq import zipf_frequency
+    words = zipf_words()
+    save_zipf_dict({word:zipf_frequency(word, 'eng') for word in words}, path)
+
+
+def check_name(name):
+    """Raises `ValueError` unless `name` is an artifact managed here; see
+    `DEPENDENCIES`.
+
+    """
+
+    if name not in DEPENDENCIES:
+        raise ValueError('Unknown artifact {!r}; expected one of {}'.format(name, ', '.join(DEPENDENCIES)))
+
+
+def fresh(name, length = 5):
+    """Returns why artifact `name` needs rebuilding; `None` when fresh.
+
+    """
+
+    check_name(name)
+    from Solver.PatternTable import PatternTable, TABLE_PATH
+    from Solver.PartitionIndex import IDS_PATH, OFFSETS_PATH
+    if name == 'zipf_dict':
+        words = zipf_words()
+        return check([ZIPF_PATH], stamp(name, words, np.arange(len(words)), 5))
+    words, answer_ids = PatternTable.load_words(length)
+    if name == 'pattern_table':
+        paths = [length_path(TABLE_PATH, length)]
+    elif name == 'partition_index':
+        paths = [length_path(IDS_PATH, length), length_path(OFFSETS_PATH, length)]
+    return check(paths, stamp(name, words, answer_ids, length))
+
+
+def build(name, length = 5):
+    """Rebuilds artifact `name`.
+
+    """
+
+    check_name(name)
+    from Solver.PatternTable import PatternTable
+    from Solver.PartitionIndex import PartitionIndex
+    if name == 'pattern_table':
+        PatternTable.load(length, compute = True)
+    elif name == 'partition_index':
+        PartitionIndex.load(PatternTable.load(length), rebuild = True)
+    elif name == 'zipf_dict':
+        build_zipf_dict()
+
+
+def ensure(names = ('pattern_table', 'partition_index'), length = 5, workers = None):
+    """Rebuilds missing or stale artifacts, independent ones in parallel.
+
+    Intended for deployment and start-up; loaders on the hot path only
+    validate and raise `StaleArtifactError`.
+
+    Parameters
+    ----------
+    names : iterable
+        Artifacts to check; dependencies are checked too. Raises
+        `ValueError` for names not in `DEPENDENCIES`.
+
+    length : int
+
+    workers : int
+        Maximum number of parallel builds.
+
+    Returns
+    -------
+    rebuilt : list
+        Names of rebuilt artifacts.
+
+    """
+
+    names = list(names)
+    for name in names:
+        check_name(name)
+    # Order artifacts after their dependencies
+    ordered = []
+    def visit(name):
+        for dependency in DEPENDENCIES[name]:
+            visit(dependency)
+        if name not in ordered:
+            ordered.append(name)
+    for name in names:
+        visit(name)
+    stale = [name for name in ordered if fresh(name, length) is not None]
+    if not stale:
+        return []
+    with ThreadPoolExecutor(max_workers = workers) as pool:
+        futures = {}
+        def run(name):
+            for dependency in DEPENDENCIES[name]:
+                if dependency in futures:
+                    futures[dependency].result()
+            build(name, length)
+        # Dependencies are submitted (and thus started) before dependents
+        for name in stale:
+            futures[name] = pool.submit(run, name)
+        for future in futures.values():
+            future.result()
+    return stale
+
+
+if __name__ == '__main__':
+    # python -m Solver.Artifacts [length] [names ...]
+    args = sys.argv[1:]
+    length = int(args.pop(0)) if args and args[0].isdigit() else 5
+    try:
+        rebuilt = ensure(args or ('pattern_table', 'partition_index'), length)
+    except ValueError as error:
+        sys.exit(str(error))
+    print('Rebuilt: {}'.format(', '.join(rebuilt) if rebuilt else 'nothing'))
@@ -0,0 +1,152 @@
+# Import aux libraries
+import numpy as np
+# Import solver modules
+from Solver.Profiler import profiler
+
+
+class BatchSimulator:
+
+    """Lockstep simulation of many offline games of the cheap bot policies.
+
+    Games advance together one move at a time as arrays: a secret answer
+    vector, a (games, answers) candidate mask and a guess vector. Each move
+    gathers the patterns of all games at once and narrows every mask with
+    one comparison; solved games are dropped from the arrays. All three
+    policies guess answers only, so games run over the (answers, answers)
+    block of the table, with words referred to by their answer position.
+
+    Policies
+    --------
+    'random' : RandomBot; uniform guess from all answers, no narrowing.
+
+    'reduce' : ReduceBot; uniform guess among the remaining candidates.
+
+    'zipf'   : ZipfBot; random opener, then the remaining candidate with the
+               highest Zipf frequency (first in answer order on ties).
+
+    Candidates are narrowed by exact pattern consistency, which the letter
+    set filtering of the browser bots approximates.
+
+    Methods
+    -------
+    simulate(secrets)
+        Plays one game per secret answer.
+
+    """
+
+    POLICIES = ('random', 'reduce', 'zipf')
+
+    def __init__(self, table, policy = 'reduce', zipf = None, max_moves = 6, batch = 4096, seed = None):
+        """Constructs simulator over a pattern table.
+
+        Attributes
+        ----------
+        table : PatternTable
+
+        policy : str
+            One of `POLICIES`.
+
+        zipf : dict or np.ndarray
+            Zipf frequencies, keyed by word or aligned to `table.answer_ids`;
+            required by the 'zipf' policy.
+
+        max_moves : int
+            Attempts per game.
+
+        batch : int
+            Games advanced together; bounds the (batch, answers) mask.
+
+        seed : int
+
+        """
+
+        if policy not in self.POLICIES:
+            raise ValueError('Unknown policy {!r}; expected one of {}'.format(policy, self.POLICIES))
+        if policy == 'zipf' and zipf is None:
+            raise ValueError("The 'zipf' policy requires Zipf frequencies")
+        self.table = table
+        # Answer block of the table; rows are gathered contiguously
+        self.answer_table = table.table[np.ix_(table.answer_ids, table.answer_ids)]
+        self.policy = policy
+        self.max_moves = max_moves
+        self.batch = batch
+        self.rng = np.random.default_rng(seed)
+        if isinstance(zipf, dict):
+            zipf = np.array([zipf[table.words[i]] for i in table.answer_ids])
+        self.zipf = zipf
+
+    def __random_candidates(self, mask):
+        # Uniform pick among the set entries of each mask row
+        counts = mask.sum(axis = 1)
+        k = (self.rng.random(len(mask)) * counts).astype(counts.dtype)
+        dtype = np.uint16 if mask.shape[1] < 2**16 else np.uint32
+        return (mask.cumsum(axis = 1, dtype = dtype) > k[:, None]).argmax(axis = 1)
+
+    def __choose(self, mask, move):
+        """Returns answer positions guessed by every active game.
+
+        """
+
+        if self.policy == 'random':
+            return self.rng.integers(len(self.table.answer_ids), size = len(mask))
+        if self.policy == 'zipf' and move > 0:
+            return np.where(mask, self.zipf, -np.inf).argmax(axis = 1)
+        return self.__random_candidates(mask)
+
+    def __run(self, secrets):
+        """Plays one batch of games in lockstep.
+
+        """
+
+        table = self.answer_table
+        moves = np.zeros(len(secrets), dtype = np.uint8)
+        solved = np.zeros(len(secrets), dtype = bool)
+        active = np.arange(len(secrets))
+        mask = np.ones((len(secrets), len(table)), dtype = bool)
+        for move in range(self.max_moves):
+            guesses = self.__choose(mask, move)
+            patterns = table[guesses, secrets[active]]
+            moves[active] += 1
+            won = patterns == self.table.solved_pattern
+            solved[active[won]] = True
+            active, mask, guesses, patterns = active[~won], mask[~won], guesses[~won], patterns[~won]
+            if not len(active):
+                break
+            if self.policy != 'random':
+                mask &= table[guesses] == patterns[:, None]
+        return moves, solved
+
+    def simulate(self, secrets):
+        """Plays one game per secret answer.
+
+        Parameters
+        ----------
+        secrets : iterable
+            Secret answers, as words or vocabulary ids.
+
+        Returns
+        -------
+        moves : np.ndarray
+            Guesses played in each game.
+
+        solved : np.ndarray
+            Whether each game was solved within `max_moves`.
+
+        """
+
+        secrets = np.asarray(secrets)
+        if secrets.dtype.kind in 'US':
+            secrets = self.table.word_ids(secrets)
+        # Vocabulary ids to answer positions
+        positions = np.searchsorted(self.table.answer_ids, secrets)
+        if np.any(self.table.answer_ids[np.minimum(positions, len(self.table.answer_ids) - 1)] != secrets):
+            raise ValueError('Secrets must be answer words')
+        secrets = positions
+        moves = np.empty(len(secrets), dtype = np.uint8)
+        solved = np.empty(len(secrets), dtype = bool)
+        with profiler.timer('batch_simulation'):
+            for start in range(0, len(secrets), self.batch):
+                stop = start + self.batch
+                moves[start:stop], solved[start:stop] = self.__run(secrets[start:stop])
+        profiler.count('simulated_games', len(secrets))
+        return moves, solved
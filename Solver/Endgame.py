@@ -0,0 +1,183 @@
+# Import aux libraries
+import os
+import time
+import pickle
+import numpy as np
+# Import solver modules
+from Solver import Scoring
+from Solver import Artifacts
+from Solver.Profiler import profiler
+
+# Default location of the persistent endgame cache
+CACHE_PATH = os.path.join('Data', 'endgame_cache.pkl')
+
+# Stand-in for an unbounded search limit
+UNBOUNDED = 2**62
+
+
+class EndgameTimeout(Exception):
+
+    """Raised inside the search when the time cap of a solve is exceeded.
+
+    """
+
+
+class EndgameSolver:
+
+    """Exact minimum-expected-guesses search over small candidate sets.
+
+    Searches every guess of a pool over the pattern table, recursing into
+    each pattern bucket. Costs are kept as the total number of guesses over
+    all candidates (expected guesses times the candidate count), so they are
+    integers and branches are pruned with the bound
+
+        total(S) >= 2|S| - 1
+
+    (one guess for every candidate, a second for all but one). Exact results
+    are memoized on the sorted candidate set, and the memo can be saved to
+    and loaded from a stamped cache file, so endgames repeated across games
+    and runs cost one lookup.
+
+    The pool is the candidates plus the `extra` highest entropy other words;
+    in hard mode only candidates are used, as they stay consistent with every
+    hint of any sub-state.
+
+    Methods
+    -------
+    solve(candidates, hard_mode)
+        Returns the best guess and its expected guesses, or `None`.
+
+    save()
+        Writes the memo to the cache file.
+
+    """
+
+    def __init__(self, table, max_candidates = 24, extra = 20, time_limit = 1.0, cache_path = None):
+        """Constructs solver over a pattern table.
+
+        Attributes
+        ----------
+        table : PatternTable
+
+        max_candidates : int
+            Largest candidate set searched; larger sets are left to the
+            greedy objective.
+
+        extra : int
+            Non-candidate guesses added to the pool of each state.
+
+        time_limit : float
+            Seconds a single solve may take before giving up.
+
+        cache_path : str
+            Persistent cache; loaded when fresh. Defaults to `CACHE_PATH`.
+
+        """
+
+        self.table = table
+        self.max_candidates = max_candidates
+        self.extra = extra
+        self.time_limit = time_limit
+        self.cache_path = cache_path or Artifacts.length_path(CACHE_PATH, table.length)
+        self.stamp = Artifacts.stamp('endgame_cache', table.words, table.answer_ids, table.length)
+        # Key : (extra, candidate id bytes), value : (total guesses, guess id)
+        self.cache = {}
+        if Artifacts.check([self.cache_path], self.stamp) is None:
+            with open(self.cache_path, 'rb') as file:
+                self.cache = pickle.load(file)
+
+    def save(self):
+        """Writes the memo atomically to the cache file with its stamp.
+
+        """
+
+        Artifacts.save([Artifacts.save_pickle(self.cache_path, self.cache)], self.stamp)
+
+    def __pool(self, candidates, extra):
+        """Returns the guesses searched at a state, best entropy first.
+
+        """
+
+        pool = candidates
+        if extra:
+            guess_ids = np.arange(len(self.table.words))
+            scores = Scoring.guess_entropies(self.table.table, guess_ids, candidates, self.table.n_patterns, 1)
+            others = guess_ids[Scoring.rank(scores)[:extra + len(candidates)]]
+            others = others[~np.isin(others, candidates)][:extra]
+            pool = np.concatenate([candidates, others])
+        scores = Scoring.guess_entropies(self.table.table, pool, candidates, self.table.n_patterns, 1)
+        return pool[Scoring.rank(scores, np.isin(pool, candidates))]
+
+    def __search(self, candidates, extra, limit):
+        """Returns the minimum total guesses over `candidates` and the guess
+        achieving it.
+
+        Only totals up to `limit` are searched; when none exists, `limit + 1`
+        and `None` are returned (and nothing is memoized).
+
+        """
+
+        n = len(candidates)
+        if n <= 2:
+            return 2 * n - 1, candidates[0]
+        key = (extra, candidates.tobytes())
+        if key in self.cache:
+            return self.cache[key]
+        if time.perf_counter() > self.deadline:
+            raise EndgameTimeout
+        lower = 2 * n - 1
+        best, best_guess = limit + 1, None
+        if lower > limit:
+            return best, best_guess
+        for guess in self.__pool(candidates, extra):
+            row = self.table.table[guess, candidates]
+            patterns, inverse, sizes = np.unique(row, return_inverse = True, return_counts = True)
+            # A guess that keeps every candidate together makes no progress
+            if len(patterns) == 1:
+                continue
+            buckets = [candidates[inverse == i] for i in np.argsort(-sizes, kind = 'stable')
+                       if patterns[i] != self.table.solved_pattern]
+            total = n + sum(2 * len(bucket) - 1 for bucket in buckets)
+            for bucket in buckets:
+                if total >= best:
+                    break
+                bound = 2 * len(bucket) - 1
+                sub, _ = self.__search(bucket, extra, best - 1 - (total - bound))
+                total += sub - bound
+            if total < best:
+                best, best_guess = total, guess
+                if best == lower:
+                    break
+        if best_guess is not None:
+            self.cache[key] = (int(best), int(best_guess))
+        return best, best_guess
+
+    def solve(self, candidates, hard_mode = False):
+        """Finds the guess minimizing the expected number of guesses.
+
+        Parameters
+        ----------
+        candidates : np.ndarray
+            Indices of remaining candidate answers.
+
+        hard_mode : bool
+            Indicate to search candidate guesses only.
+
+        Returns
+        -------
+        result : tuple
+            (guess, expected guesses including it); `None` when there are
+            more than `max_candidates` candidates or the time cap is hit.
+
+        """
+
+        if not 0 < len(candidates) <= self.max_candidates:
+            return None
+        candidates = np.sort(np.asarray(candidates, dtype = np.int32))
+        self.deadline = time.perf_counter() + self.time_limit
+        try:
+            total, guess = self.__search(candidates, 0 if hard_mode else self.extra, UNBOUNDED)
+        except EndgameTimeout:
+            profiler.count('endgame_timeouts')
+            return None
+        return str(self.table.words[guess]), total / len(candidates)
@@ -0,0 +1,382 @@
+# Import aux libraries
+import numpy as np
+# Import solver modules
+from Solver import Scoring
+from Solver.IncrementalScorer import IncrementalScorer
+from Solver.GuessClasses import GuessClasses
+from Solver.Profiler import profiler
+
+
+class EntropySolver:
+
+    """Browser independent game state and greedy entropy guess selection.
+
+    Keeps the remaining candidate answers and the allowed guesses as index
+    arrays into the pattern table; both are narrowed each turn by masking a
+    single table row.
+
+    Methods
+    -------
+    reset()
+        Restores the full candidate and guess sets.
+
+    calculate_entropies()
+        Scores every allowed guess against the current candidates.
+
+    top_guesses(k)
+        Returns the `k` highest entropy guesses.
+
+    best_guess()
+        Returns the highest entropy guess.
+
+    apply(guess, pattern)
+        Narrows the game state with the evaluation of a played guess.
+
+    suggest_many(histories)
+        Suggests next guesses for many game histories at once.
+
+    """
+
+    # Supported guess selection objectives
+    OBJECTIVES = ('entropy', 'minimax')
+
+    def __init__(self, table, hard_mode = False, incremental = False, index = None, dedup = False, threads = None,
+                 objective = 'entropy', endgame = None):
+        """Constructs solver over a pattern table.
+
+        Attributes
+        ----------
+        table : PatternTable
+
+        hard_mode : bool
+            Indicate every guess must be consistent with all revealed hints;
+            the allowed-guess set is then narrowed alongside the candidates.
+
+        incremental : bool
+            Indicate to maintain pattern histograms across moves with an
+            `IncrementalScorer` instead of rebuilding them every turn.
+
+        index : PartitionIndex
+            Optional partition index; while the candidates are still the full
+            answer set, entropies come from its bucket sizes and the first
+            narrowing is a slice view into it.
+
+        dedup : bool
+            Indicate to score one representative per class of guesses with
+            identical pattern rows over the live candidates; see
+            `GuessClasses`.
+
+        threads : int
+            Number of threads scoring chunks of the guess axis; defaults to
+            `Scoring.THREADS`.
+
+        objective : str
+            Guess selection objective;
+            -> 'entropy' : maximize expected information
+            -> 'minimax' : minimize the largest remaining bucket (worst case),
+                           ties broken by entropy
+
+        endgame : EndgameSolver
+            Optional exact search; once the candidates fit within its
+            `max_candidates`, `best_guess` plays the move minimizing the
+            expected number of guesses instead.
+
+        """
+
+        if objective not in self.OBJECTIVES:
+            raise ValueError('Unknown objective: {}'.format(objective))
+        self.table = table
+        self.objective = objective
+        self.hard_mode = hard_mode
+        self.index = index
+        self.threads = threads
+        self.endgame = endgame
+        self.scorer = None
+        if incremental:
+            self.scorer = IncrementalScorer(self.table.table, np.arange(len(self.table.words)),
+                                            self.table.answer_ids, self.table.n_patterns)
+        self.classes = None
+        if dedup:
+            self.classes = GuessClasses(self.table.table, np.arange(len(self.table.words)), self.table.answer_ids)
+        self.reset()
+
+    def reset(self):
+        """Restores the full candidate and guess sets.
+
+        """
+
+        # Candidates begin as all answers, allowed guesses as all words
+        self.candidates = self.table.answer_ids.copy()
+        self.allowed = np.arange(len(self.table.words))
+        self.narrowed = False
+        if self.scorer is not None:
+            self.scorer.reset()
+        if self.classes is not None:
+            self.classes.reset()
+
+    @property
+    def word_state(self):
+        """Array of remaining candidate answer words."""
+        return self.table.words[self.candidates]
+
+    def calculate_entropies(self):
+        """Calculates the entropy of every allowed guess over the current
+        candidates.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        guess_ids : np.ndarray
+
+        entropies : np.ndarray
+
+        """
+
+        with profiler.timer('entropy_scoring'):
+            # Score class representatives only; positions into `allowed`
+            representatives = slice(None)
+            if self.classes is not None:
+                representatives, inverse = self.classes.classes()
+            if self.scorer is not None:
+                _, scores = self.scorer.entropies(representatives)
+            elif self.index is not None and not self.narrowed:
+                scores = Scoring.entropies(self.index.bucket_sizes(self.allowed[representatives]))
+            else:
+                scores = Scoring.guess_entropies(self.table.table, self.allowed[representatives],
+                                                 self.candidates, self.table.n_patterns, self.threads)
+            # Fan class scores back out to every allowed guess
+            if self.classes is not None:
+                scores = scores[inverse]
+        profiler.count('guesses_scored', len(self.allowed))
+        if self.classes is not None:
+            profiler.count('guess_classes_scored', len(representatives))
+        return self.allowed, scores
+
+    def top_guesses(self, k):
+        """Returns the `k` best guesses under the solver objective.
+
+        Ties are broken in favour of guesses that may still be the answer.
+
+        Parameters
+        ----------
+        k : int
+
+        Returns
+        -------
+        guesses : np.ndarray
+
+        scores : np.ndarray
+            Entropies; largest bucket sizes under the 'minimax' objective.
+
+        """
+
+        is_candidate = np.isin(self.allowed, self.candidates)
+        if self.objective == 'minimax':
+            return self.__top_minimax(k, is_candidate)
+        # Plain scoring; chunks keep their own top `k`, merged afterwards
+        if self.scorer is None and self.classes is None and (self.index is None or self.narrowed):
+            with profiler.timer('entropy_scoring'):
+                order, scores = Scoring.top_entropies(self.table.table, self.allowed, self.candidates, k,
+                                                      self.table.n_patterns, self.threads, is_candidate)
+            profiler.count('guesses_scored', len(self.allowed))
+            return self.table.words[self.allowed[order]], scores
+        # Sort by entropy, then by candidacy
+        guess_ids, scores = self.calculate_entropies()
+        order = Scoring.rank(scores, is_candidate)[:k]
+        return self.table.words[guess_ids[order]], scores[order]
+
+    def __top_minimax(self, k, is_candidate):
+        """Returns the `k` guesses with the smallest largest bucket.
+
+        """
+
+        with profiler.timer('minimax_scoring'):
+            # Reuse maintained or free histograms when available
+            counts = None
+            if self.scorer is not None:
+                counts = self.scorer.counts
+            elif self.index is not None and not self.narrowed:
+                counts = self.index.bucket_sizes(self.allowed)
+            if counts is not None:
+                worst, scores = counts.max(axis = 1), Scoring.entropies(counts)
+                order = Scoring.rank(-worst, is_candidate, scores)[:k]
+                worst = worst[order]
+            else:
+                order, worst, _ = Scoring.top_minimax(self.table.table, self.allowed, self.candidates, k,
+                                                      self.table.n_patterns, self.threads, is_candidate)
+        profiler.count('guesses_scored', len(self.allowed))
+        return self.table.words[self.allowed[order]], worst
+
+    def best_guess(self):
+        """Returns the best guess under the solver objective.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        guess : str
+
+        score : float
+            Objective score; expected guesses when played by the endgame
+            search.
+
+        """
+
+        # Single candidate left; nothing to score
+        if len(self.candidates) == 1:
+            return self.word_state[0], 0.0
+        # Small candidate set; exact search unless it times out
+        if self.endgame is not None and len(self.candidates) <= self.endgame.max_candidates:
+            with profiler.timer('endgame_search'):
+                result = self.endgame.solve(self.candidates, self.hard_mode)
+            if result is not None:
+                return result
+        guesses, scores = self.top_guesses(1)
+        return guesses[0], scores[0]
+
+    def apply(self, guess, pattern):
+        """Narrows candidates (and allowed guesses in hard mode) to those
+        consistent with `guess` evaluating to `pattern`.
+
+        Parameters
+        ----------
+        guess : str
+
+        pattern : int
+
+        Returns
+        -------
+        None
+
+        """
+
+        with profiler.timer('state_filtering'):
+            guess_id = self.table.index[guess]
+            row = self.table.table[guess_id]
+            n_candidates = len(self.candidates)
+            if self.index is not None and not self.narrowed:
+                # Full answer set; survivors are a bucket of the index
+                removed = None
+                self.candidates = self.index.bucket(guess_id, pattern)
+            else:
+                matches = row[self.candidates] == pattern
+                removed = self.candidates[~matches]
+                self.candidates = self.candidates[matches]
+            self.narrowed = True
+            keep = None
+            if self.hard_mode:
+                keep = row[self.allowed] == pattern
+                self.allowed = self.allowed[keep]
+        if removed is None and (self.scorer is not None or self.classes is not None):
+            removed = np.setdiff1d(self.table.answer_ids, self.candidates, assume_unique = True)
+        if self.scorer is not None:
+            with profiler.timer('histogram_update'):
+                self.scorer.update(removed, self.candidates, keep)
+        if self.classes is not None:
+            with profiler.timer('class_update'):
+                self.classes.update(removed, self.candidates, keep)
+        profiler.count('candidates_removed', n_candidates - len(self.candidates))
+
+    def __best_of_state(self, candidates, allowed, initial):
+        """Returns the best guess of a detached state under the solver
+        objective, with the score `top_guesses` would report.
+
+        `initial` indicates the state is the full answer set, whose
+        histograms are read from the partition index when available.
+
+        """
+
+        is_candidate = np.isin(allowed, candidates)
+        counts = self.index.bucket_sizes(allowed) if self.index is not None and initial else None
+        if self.objective == 'minimax':
+            with profiler.timer('minimax_scoring'):
+                if counts is not None:
+                    worst = counts.max(axis = 1)
+                    best = Scoring.rank(-worst, is_candidate, Scoring.entropies(counts))[:1]
+                    score = worst[best[0]]
+                else:
+                    best, worst, _ = Scoring.top_minimax(self.table.table, allowed, candidates, 1, self.table.n_patterns,
+                                                         self.threads, is_candidate)
+                    score = worst[0]
+        else:
+            with profiler.timer('entropy_scoring'):
+                if counts is not None:
+                    scores = Scoring.entropies(counts)
+                    best = Scoring.rank(scores, is_candidate)[:1]
+                    score = scores[best[0]]
+                else:
+                    best, scores = Scoring.top_entropies(self.table.table, allowed, candidates, 1, self.table.n_patterns,
+                                                         self.threads, is_candidate)
+                    score = scores[0]
+        return str(self.table.words[allowed[best[0]]]), score
+
+    def suggest_many(self, histories):
+        """Suggests the next guess for many independent game histories.
+
+        Each history is canonicalized into its candidate set (and allowed
+        guesses in hard mode); histories sharing a prefix narrow it once, and
+        identical states are scored once and fanned back out. Cost therefore
+        depends on the number of distinct states, not requests. The solver's
+        own game state is left untouched.
+
+        Parameters
+        ----------
+        histories : list
+            Each a sequence of (guess, pattern id) moves.
+
+        Returns
+        -------
+        suggestions : list
+            Per history a dictionary with the suggested 'guess', its 'score'
+            under the solver objective (as in `best_guess`, including the
+            endgame search) and the number of remaining 'candidates'. The
+            guess is `None` when no answer is consistent with the history.
+
+        """
+
+        n_words = len(self.table.words)
+        # Narrowed (candidates, allowed) by history prefix
+        states = {(): (self.table.answer_ids, np.arange(n_words))}
+        def narrow(history):
+            if history not in states:
+                candidates, allowed = narrow(history[:-1])
+                guess, pattern = history[-1]
+                row = self.table.table[self.table.index[guess]]
+                candidates = candidates[row[candidates] == pattern]
+                if self.hard_mode:
+                    allowed = allowed[row[allowed] == pattern]
+                states[history] = (candidates, allowed)
+            return states[history]
+        # Group requests by canonical state key
+        groups = {}
+        for i, history in enumerate(histories):
+            history = tuple((guess, int(pattern)) for guess, pattern in history)
+            candidates, allowed = narrow(history)
+            key = candidates.tobytes() + (allowed.tobytes() if self.hard_mode else b'')
+            if key not in groups:
+                groups[key] = (history, [])
+            groups[key][1].append(i)
+        profiler.count('suggest_requests', len(histories))
+        profiler.count('suggest_states', len(groups))
+        # Score each distinct state once
+        suggestions = [None] * len(histories)
+        for history, positions in groups.values():
+            candidates, allowed = states[history]
+            if len(candidates) <= 1:
+                guess = str(self.table.words[candidates[0]]) if len(candidates) else None
+                score = 0.0
+            else:
+                result = None
+                # Small candidate set; exact search as in `best_guess`
+                if self.endgame is not None and len(candidates) <= self.endgame.max_candidates:
+                    with profiler.timer('endgame_search'):
+                        result = self.endgame.solve(candidates, self.hard_mode)
+                guess, score = result if result is not None else self.__best_of_state(candidates, allowed, not history)
+            for i in positions:
+                suggestions[i] = {'guess' : guess, 'score' : float(score), 'candidates' : len(candidates)}
+        return suggestions
@@ -0,0 +1,189 @@
+# Import aux libraries
+import os
+import json
+import time
+import numpy as np
+# Import solver modules
+from Solver.PatternTable import pattern_dtype
+
+# Binary log layout;
+#   -> Header : MAGIC, word length (uint8), pattern id width in bytes (uint8)
+#   -> Game   : number of moves (uint8), then per move the guess as ASCII
+#               bytes followed by its little-endian pattern id
+#   -> A five letter move therefore takes 5 + 1 = 6 bytes
+MAGIC = b'WLG1'
+
+
+def is_jsonl(path):
+    """Returns whether `path` names a JSONL log rather than a binary one.
+
+    """
+
+    return os.path.splitext(path)[1] == '.jsonl'
+
+
+class GameLogWriter:
+
+    """Append-only writer of played games as guesses plus pattern ids.
+
+    Logs ending in '.jsonl' are written one JSON object per game; all other
+    paths use the compact binary layout. Appending to an existing binary log
+    checks its header matches the word length.
+
+    Methods
+    -------
+    write(guesses, patterns)
+        Appends one game.
+
+    close()
+        Closes the underlying file.
+
+    """
+
+    def __init__(self, path, length = 5):
+        """Opens (or creates) log at `path` for appending.
+
+        Attributes
+        ----------
+        path : str
+
+        length : int
+            Number of letters per word.
+
+        """
+
+        self.path = path
+        self.length = length
+        self.jsonl = is_jsonl(path)
+        self.dtype = pattern_dtype(length).newbyteorder('<')
+        if self.jsonl:
+            self.file = open(path, 'a')
+            return
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with open(path, 'rb') as log:
+                header = log.read(len(MAGIC) + 2)
+            if header != self.__header():
+                raise ValueError('Game log {} does not match word length {}'.format(path, length))
+        self.file = open(path, 'ab')
+        if not exists:
+            self.file.write(self.__header())
+
+    def __header(self):
+        return MAGIC + bytes((self.length, self.dtype.itemsize))
+
+    def write(self, guesses, patterns):
+        """Appends one game.
+
+        Parameters
+        ----------
+        guesses : list
+            Played guesses in order.
+
+        patterns : list
+            Pattern id of each guess.
+
+        Returns
+        -------
+        None
+
+        """
+
+        if len(guesses) != len(patterns):
+            raise ValueError('Every guess needs a pattern')
+        if self.jsonl:
+            self.file.write(json.dumps({'guesses' : list(guesses), 'patterns' : [int(p) for p in patterns]}) + '\n')
+            return
+        if len(guesses) > 255:
+            raise ValueError('Games are limited to 255 moves')
+        record = np.zeros(len(guesses), dtype = [('guess', 'S{}'.format(self.length)), ('pattern', self.dtype)])
+        record['guess'] = [guess.encode('ascii') for guess in guesses]
+        record['pattern'] = patterns
+        self.file.write(bytes((len(guesses),)) + record.tobytes())
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def read_games(path):
+    """Streams games from a log one at a time.
+
+    Parameters
+    ----------
+    path : str
+
+    Returns
+    -------
+    games : generator
+        Yields (guesses, patterns) tuples of lists.
+
+    """
+
+    if is_jsonl(path):
+        with open(path) as log:
+            for line in log:
+                if line.strip():
+                    game = json.loads(line)
+                    yield game['guesses'], game['patterns']
+        return
+    with open(path, 'rb') as log:
+        header = log.read(len(MAGIC) + 2)
+        if header[:len(MAGIC)] != MAGIC:
+            raise ValueError('{} is not a game log'.format(path))
+        length, width = header[len(MAGIC)], header[len(MAGIC) + 1]
+        dtype = np.dtype([('guess', 'S{}'.format(length)), ('pattern', '<u{}'.format(width))])
+        while True:
+            n_moves = log.read(1)
+            if not n_moves:
+                return
+            record = np.frombuffer(log.read(n_moves[0] * dtype.itemsize), dtype = dtype)
+            yield [guess.decode('ascii') for guess in record['guess']], record['pattern'].tolist()
+
+
+def replay(path, solver):
+    """Replays logged games through a solver and compares its decisions with
+    the logged guesses.
+
+    Each logged move is applied to the solver regardless of whether it agreed,
+    so the solver is always evaluated on the historical game state. Runs as a
+    generator; logs of any size are replayed in constant memory.
+
+    Parameters
+    ----------
+    path : str
+
+    solver : object
+        Any solver exposing `reset()`, `best_guess()` and
+        `apply(guess, pattern)`; e.g. `EntropySolver`.
+
+    Returns
+    -------
+    results : generator
+        Yields per game a dictionary with the logged and suggested guesses,
+        whether each suggestion matched, and selection latency in seconds.
+
+    """
+
+    for guesses, patterns in read_games(path):
+        solver.reset()
+        suggestions = []
+        latencies = []
+        for guess, pattern in zip(guesses, patterns):
+            start = time.perf_counter()
+            suggestion, _ = solver.best_guess()
+            latencies.append(time.perf_counter() - start)
+            suggestions.append(suggestion)
+            solver.apply(guess, pattern)
+        yield {
+            'guesses' : guesses,
+            'suggestions' : suggestions,
+            'matches' : [guess == suggestion for guess, suggestion in zip(guesses, suggestions)],
+            'latencies' : latencies
+        }
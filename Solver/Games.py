@@ -0,0 +1,150 @@
+# Import aux libraries
+import numpy as np
+# Import solver modules
+from Solver.Profiler import profiler
+
+
+class OfflineGame:
+
+    """Browser free Wordle game against a fixed secret answer.
+
+    Methods
+    -------
+    reset(answer)
+        Starts a new game.
+
+    evaluate(guess)
+        Returns the pattern id of `guess` against the answer.
+
+    """
+
+    def __init__(self, table, answer = None):
+        """Constructs game over a pattern table.
+
+        Attributes
+        ----------
+        table : PatternTable
+
+        answer : str
+
+        """
+
+        self.table = table
+        self.reset(answer)
+
+    def reset(self, answer = None):
+        self.answer = answer
+        self.answer_id = None if answer is None else self.table.index[answer]
+
+    def evaluate(self, guess):
+        return int(self.table.table[self.table.index[guess], self.answer_id])
+
+
+class AdversarialGame:
+
+    """Absurdle style game; the answer is never fixed.
+
+    Every guess is answered with the pattern of the largest bucket of the
+    remaining answers (ties going to the lowest pattern id, i.e. the least
+    revealing), and the answers are narrowed to that bucket. A strategy's
+    result against this game is its worst case over all answers.
+
+    Methods
+    -------
+    reset()
+        Restores the full answer set.
+
+    evaluate(guess)
+        Returns the adversarial pattern id of `guess`.
+
+    """
+
+    def __init__(self, table):
+        """Constructs game over a pattern table.
+
+        Attributes
+        ----------
+        table : PatternTable
+
+        """
+
+        self.table = table
+        self.reset()
+
+    def reset(self, answer = None):
+        # `answer` is accepted for interchangeability with `OfflineGame`
+        self.candidates = self.table.answer_ids
+
+    def evaluate(self, guess):
+        patterns = self.table.table[self.table.index[guess], self.candidates]
+        counts = np.bincount(patterns, minlength = self.table.n_patterns)
+        pattern = int(counts.argmax())
+        self.candidates = self.candidates[patterns == pattern]
+        return pattern
+
+
+def play(solver, game, answer = None, opener = None, max_moves = 20):
+    """Plays one game of `solver` against `game`.
+
+    Parameters
+    ----------
+    solver : object
+        Any solver exposing `reset()`, `best_guess()` and
+        `apply(guess, pattern)`.
+
+    game : OfflineGame or AdversarialGame
+
+    answer : str
+        Secret answer; ignored by `AdversarialGame`.
+
+    opener : str
+        Optional fixed first guess.
+
+    max_moves : int
+        Moves after which an unsolved game is abandoned.
+
+    Returns
+    -------
+    history : list
+        (guess, pattern id) moves; the game was solved iff the last pattern
+        is the table's solved pattern.
+
+    """
+
+    solver.reset()
+    game.reset(answer)
+    history = []
+    while len(history) < max_moves:
+        guess = opener if (opener and not history) else solver.best_guess()[0]
+        pattern = game.evaluate(guess)
+        history.append((str(guess), pattern))
+        if pattern == game.table.solved_pattern:
+            break
+        solver.apply(guess, pattern)
+    profiler.count('offline_games')
+    return history
+
+
+def worst_cases(solver, table, openers, max_moves = 20):
+    """Plays the adversarial game once per opener.
+
+    Parameters
+    ----------
+    solver : object
+
+    table : PatternTable
+
+    openers : iterable
+        First guesses to benchmark.
+
+    max_moves : int
+
+    Returns
+    -------
+    results : dict
+        Key : opener, value : guesses needed against the adversary.
+
+    """
+
+    game = AdversarialGame(table)
+    return {opener:len(play(solver, game, opener = opener, max_moves = max_moves)) for opener in openers}
@@ -0,0 +1,134 @@
+# Import aux libraries
+import numpy as np
+# Import solver modules
+from Solver import Scoring
+
+
+class GuessClasses:
+
+    """Equivalence classes of guesses with identical pattern rows over the
+    live candidates.
+
+    Guesses in a class split the candidates identically and score the same,
+    so only one representative per class needs scoring. Rows are
+    fingerprinted with an additive 64-bit hash,
+
+        hash[g] = sum over live candidates c of weight[c] * (table[g, c] + 1)
+
+    which, like the pattern histograms, can be narrowed by subtracting the
+    removed candidates or rebuilt over the survivors, whichever is cheaper.
+
+    Methods
+    -------
+    reset()
+        Restores hashes over the initial candidates.
+
+    update(removed, survivors, keep)
+        Narrows the hashes to `survivors`.
+
+    classes()
+        Returns class representatives and the class of every guess.
+
+    """
+
+    def __init__(self, table, guess_ids, candidate_ids, seed = 0):
+        """Builds the initial row hashes.
+
+        Attributes
+        ----------
+        table : np.ndarray
+            (words, words) pattern table.
+
+        guess_ids : np.ndarray
+            Indices of guesses to classify.
+
+        candidate_ids : np.ndarray
+            Indices of initial candidate answers.
+
+        seed : int
+            Seed of the random per-word hash weights.
+
+        """
+
+        self.table = table
+        self.weights = np.random.default_rng(seed).integers(1, 2**63, size = table.shape[1], dtype = np.uint64)
+        self.initial_ids = guess_ids
+        self.initial = self.__hashes(guess_ids, candidate_ids)
+        self.reduction_ratio = 1.0
+        self.reset()
+
+    def __hashes(self, guess_ids, candidate_ids):
+        # Hash of an empty candidate set is zero
+        if not len(candidate_ids):
+            return np.zeros(len(guess_ids), dtype = np.uint64)
+        hashes = np.empty(len(guess_ids), dtype = np.uint64)
+        weights = self.weights[candidate_ids]
+        for chunk in Scoring.chunks(len(guess_ids), len(candidate_ids)):
+            patterns = self.table[np.ix_(guess_ids[chunk], candidate_ids)].astype(np.uint64) + np.uint64(1)
+            # Wrapping uint64 arithmetic; overflow is intended
+            hashes[chunk] = patterns @ weights
+        return hashes
+
+    def reset(self):
+        """Restores hashes over the initial candidates.
+
+        """
+
+        self.guess_ids = self.initial_ids
+        self.hashes = self.initial.copy()
+
+    def update(self, removed, survivors, keep = None):
+        """Narrows the row hashes from the previous candidates to `survivors`.
+
+        Parameters
+        ----------
+        removed : np.ndarray
+            Indices of candidates eliminated by the last move.
+
+        survivors : np.ndarray
+            Indices of candidates still live.
+
+        keep : np.ndarray
+            Optional boolean mask over tracked guesses; guesses outside it are
+            dropped.
+
+        Returns
+        -------
+        None
+
+        """
+
+        if keep is not None:
+            self.guess_ids = self.guess_ids[keep]
+            self.hashes = self.hashes[keep]
+        # Guess removed no candidates; hashes are unchanged
+        if not len(removed):
+            return
+        if len(removed) <= len(survivors):
+            self.hashes -= self.__hashes(self.guess_ids, removed)
+        else:
+            self.hashes = self.__hashes(self.guess_ids, survivors)
+
+    def classes(self):
+        """Groups tracked guesses by row hash.
+
+        Candidates are always singleton classes (only a candidate scores
+        all 'correct' against itself), so representatives keep candidacy.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        representatives : np.ndarray
+            Position in tracked guesses of one guess per class.
+
+        inverse : np.ndarray
+            Class of every tracked guess, indexing `representatives`.
+
+        """
+
+        _, representatives, inverse = np.unique(self.hashes, return_index = True, return_inverse = True)
+        self.reduction_ratio = len(self.hashes) / max(len(representatives), 1)
+        return representatives, inverse
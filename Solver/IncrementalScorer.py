@@ -0,0 +1,129 @@
+# Import aux libraries
+import numpy as np
+# Import solver modules
+from Solver import Scoring
+
+
+class IncrementalScorer:
+
+    """Pattern histograms of every guess maintained as the candidate set
+    shrinks.
+
+    Keeps a (guesses, n_patterns) count matrix over the live candidates.
+    Each update either subtracts the contributions of the removed candidates
+    or rebuilds the matrix over the survivors, whichever touches fewer
+    table entries; entropies are then refreshed from the counts alone.
+
+    Methods
+    -------
+    reset()
+        Restores the counts over the initial candidates.
+
+    update(removed, survivors, keep)
+        Narrows the counts to `survivors`.
+
+    entropies(rows)
+        Entropy of tracked guesses.
+
+    """
+
+    def __init__(self, table, guess_ids, candidate_ids, n_patterns = Scoring.N_PATTERNS):
+        """Builds the initial count matrix.
+
+        Attributes
+        ----------
+        table : np.ndarray
+            (words, words) pattern table.
+
+        guess_ids : np.ndarray
+            Indices of guesses to track.
+
+        candidate_ids : np.ndarray
+            Indices of initial candidate answers.
+
+        n_patterns : int
+
+        """
+
+        self.table = table
+        self.n_patterns = n_patterns
+        # Counts never exceed the number of candidates; store compactly
+        self.dtype = np.uint16 if len(candidate_ids) < 2**16 else np.uint32
+        self.initial_ids = guess_ids
+        self.initial = self.__counts(guess_ids, candidate_ids)
+        self.reset()
+
+    def __counts(self, guess_ids, candidate_ids):
+        counts = np.empty((len(guess_ids), self.n_patterns), dtype = self.dtype)
+        for chunk in Scoring.chunks(len(guess_ids), self.n_patterns):
+            counts[chunk] = Scoring.pattern_counts(self.table, guess_ids[chunk], candidate_ids, self.n_patterns)
+        return counts
+
+    def reset(self):
+        """Restores the counts over the initial candidates.
+
+        The initial matrix is state independent and is copied rather than
+        rebuilt.
+
+        """
+
+        self.guess_ids = self.initial_ids
+        self.counts = self.initial.copy()
+
+    def update(self, removed, survivors, keep = None):
+        """Narrows the count matrix from the previous candidates to
+        `survivors`.
+
+        Parameters
+        ----------
+        removed : np.ndarray
+            Indices of candidates eliminated by the last move.
+
+        survivors : np.ndarray
+            Indices of candidates still live.
+
+        keep : np.ndarray
+            Optional boolean mask over tracked guesses; guesses outside it are
+            dropped (e.g. no longer legal in hard mode).
+
+        Returns
+        -------
+        None
+
+        """
+
+        if keep is not None:
+            self.guess_ids = self.guess_ids[keep]
+            self.counts = self.counts[keep]
+        # Subtract removed columns or recompute over survivors; cost of either
+        # is proportional to the number of candidates histogrammed
+        if len(removed) <= len(survivors):
+            for chunk in Scoring.chunks(len(self.guess_ids), self.n_patterns):
+                delta = Scoring.pattern_counts(self.table, self.guess_ids[chunk], removed, self.n_patterns)
+                np.subtract(self.counts[chunk], delta, out = self.counts[chunk], casting = 'unsafe')
+        else:
+            self.counts = self.__counts(self.guess_ids, survivors)
+
+    def entropies(self, rows = None):
+        """Returns the entropy of tracked guesses from the current counts.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Optional positions of the tracked guesses to score; all by
+            default.
+
+        Returns
+        -------
+        guess_ids : np.ndarray
+
+        entropies : np.ndarray
+
+        """
+
+        counts = self.counts if rows is None else self.counts[rows]
+        scores = np.empty(len(counts))
+        for chunk in Scoring.chunks(len(counts), self.n_patterns):
+            scores[chunk] = Scoring.entropies(counts[chunk])
+        guess_ids = self.guess_ids if rows is None else self.guess_ids[rows]
+        return guess_ids, scores
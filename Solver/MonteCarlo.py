@@ -0,0 +1,170 @@
+# Import aux libraries
+import argparse
+import numpy as np
+from statistics import NormalDist
+from concurrent.futures import ThreadPoolExecutor
+# Import solver modules
+from Solver import Artifacts
+from Solver.Games import OfflineGame, play
+from Solver.Profiler import profiler
+
+
+def zipf_weights(table, zipf_dict = None):
+    """Returns answer sampling weights proportional to word frequency.
+
+    Zipf values are log10 occurrences per billion words, so the frequency of
+    a word is 10**zipf.
+
+    Parameters
+    ----------
+    table : PatternTable
+
+    zipf_dict : dict
+        Key : word, value : Zipf frequency; loaded from `Data` when omitted.
+
+    Returns
+    -------
+    weights : np.ndarray
+        Aligned to `table.answer_ids`.
+
+    """
+
+    if zipf_dict is None:
+        zipf_dict = Artifacts.load_zipf_dict()
+    return np.array([10**zipf_dict.get(str(table.words[i]), 0.0) for i in table.answer_ids])
+
+
+def interval(moves, confidence = 0.95):
+    """Returns the normal confidence interval of the mean of `moves`.
+
+    Parameters
+    ----------
+    moves : np.ndarray
+
+    confidence : float
+
+    Returns
+    -------
+    mean : float
+
+    half_width : float
+
+    """
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return moves.mean(), z * moves.std(ddof = 1) / np.sqrt(len(moves))
+
+
+def evaluate(make_solver, table, weights = None, target = 0.05, confidence = 0.95, batch = 200, min_games = 100,
+             max_games = None, workers = 1, opener = None, max_moves = 20, seed = 0):
+    """Estimates the mean guesses of a strategy from sampled answers.
+
+    Answers are drawn with replacement with probability proportional to
+    `weights`, so the estimate is of the weighted mean over the answer list.
+    Games are played `batch` at a time, split across `workers` threads each
+    holding its own solver, until the confidence interval is narrower than
+    `target`. Evaluations with the same `seed` sample the same answers,
+    which tightens A/B comparisons.
+
+    Parameters
+    ----------
+    make_solver : callable
+        Returns a fresh solver; see `Games.play`.
+
+    table : PatternTable
+
+    weights : np.ndarray
+        Sampling weights aligned to `table.answer_ids`; uniform when omitted.
+
+    target : float
+        Interval width (in guesses) at which sampling stops.
+
+    confidence : float
+
+    batch : int
+        Games played between interval checks.
+
+    min_games : int
+        Games played before stopping is considered.
+
+    max_games : int
+        Hard cap on games; defaults to no cap. At least 2, the fewest games
+        an interval is defined for.
+
+    workers : int
+        Threads playing games.
+
+    opener : str
+        Optional fixed first guess.
+
+    max_moves : int
+
+    seed : int
+
+    Returns
+    -------
+    result : dict
+        'games' played, 'mean' guesses, its 'low' and 'high' interval
+        bounds, and the 'solved' fraction within `max_moves`.
+
+    """
+
+    if max_games is not None and max_games < 2:
+        raise ValueError('max_games must be at least 2 to estimate an interval, got {}'.format(max_games))
+    if batch < 1:
+        raise ValueError('batch must be positive, got {}'.format(batch))
+    rng = np.random.default_rng(seed)
+    p = None if weights is None else np.asarray(weights, dtype = np.float64) / np.sum(weights)
+    solvers = [make_solver() for _ in range(workers)]
+    games = [OfflineGame(table) for _ in range(workers)]
+    moves, solved = [], []
+    def run(worker, answers):
+        results = []
+        for answer in answers:
+            history = play(solvers[worker], games[worker], table.words[answer], opener, max_moves)
+            results.append((len(history), history[-1][1] == table.solved_pattern))
+        return results
+    with ThreadPoolExecutor(max_workers = workers) as pool:
+        while max_games is None or len(moves) < max_games:
+            size = batch if max_games is None else min(batch, max_games - len(moves))
+            answers = rng.choice(table.answer_ids, size, p = p)
+            with profiler.timer('monte_carlo'):
+                for results in pool.map(run, range(workers), np.array_split(answers, workers)):
+                    for n, won in results:
+                        moves.append(n)
+                        solved.append(won)
+            mean, half_width = interval(np.array(moves), confidence)
+            if len(moves) >= min_games and 2 * half_width <= target:
+                break
+    return {
+        'games' : len(moves),
+        'mean' : float(mean),
+        'low' : float(mean - half_width),
+        'high' : float(mean + half_width),
+        'solved' : float(np.mean(solved))
+    }
+
+
+if __name__ == '__main__':
+    # python -m Solver.MonteCarlo [--objective O] [--zipf] [--target T] [--workers W] [--opener WORD]
+    from Solver.PatternTable import PatternTable
+    from Solver.PartitionIndex import PartitionIndex
+    from Solver.EntropySolver import EntropySolver
+    parser = argparse.ArgumentParser(description = 'Monte Carlo estimate of mean guesses.')
+    parser.add_argument('--objective', default = 'entropy', choices = EntropySolver.OBJECTIVES)
+    parser.add_argument('--hard-mode', action = 'store_true')
+    parser.add_argument('--zipf', action = 'store_true', help = 'weight answers by Zipf frequency')
+    parser.add_argument('--target', type = float, default = 0.05, help = 'confidence interval width')
+    parser.add_argument('--confidence', type = float, default = 0.95)
+    parser.add_argument('--max-games', type = int, default = None)
+    parser.add_argument('--workers', type = int, default = 1)
+    parser.add_argument('--opener', default = None)
+    parser.add_argument('--seed', type = int, default = 0)
+    args = parser.parse_args()
+    table = PatternTable.load()
+    index = PartitionIndex.load(table)
+    make_solver = lambda: EntropySolver(table, args.hard_mode, index = index, objective = args.objective)
+    weights = zipf_weights(table) if args.zipf else None
+    result = evaluate(make_solver, table, weights, args.target, args.confidence, max_games = args.max_games,
+                      workers = args.workers, opener = args.opener, seed = args.seed)
+    print('{games} games: {mean:.4f} guesses [{low:.4f}, {high:.4f}], solved {solved:.2%}'.format(**result))
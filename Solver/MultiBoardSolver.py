@@ -0,0 +1,201 @@
+# Import aux libraries
+import copy
+import numpy as np
+# Import solver modules
+from Solver import Scoring
+from Solver.IncrementalScorer import IncrementalScorer
+from Solver.Profiler import profiler
+
+
+class MultiBoardSolver:
+
+    """Game state and joint guess selection for multi-board variants
+    (Dordle, Quordle, Octordle).
+
+    Every guess is played on all unsolved boards at once; each board keeps its
+    own candidate index array and guesses are scored against all of them in
+    one batched pass over the pattern table.
+
+    Methods
+    -------
+    reset()
+        Restores the full candidate set on every board.
+
+    calculate_scores()
+        Scores every allowed guess jointly over all unsolved boards.
+
+    best_guess()
+        Returns the highest scoring guess.
+
+    apply(guess, patterns)
+        Narrows each board with its evaluation of a played guess.
+
+    """
+
+    # Supported joint scoring objectives
+    OBJECTIVES = ('entropy', 'solved')
+
+    def __init__(self, table, n_boards = 4, objective = 'entropy', incremental = False):
+        """Constructs solver over a pattern table.
+
+        Attributes
+        ----------
+        table : PatternTable
+
+        n_boards : int
+            Number of independent boards; 2 (Dordle) through 8 (Octordle).
+
+        objective : str
+            Joint scoring objective;
+            -> 'entropy' : sum of entropies over unsolved boards
+            -> 'solved'  : expected number of boards solved by the guess,
+                           ties broken by summed entropy
+
+        incremental : bool
+            Indicate to maintain each board's pattern histograms across moves
+            with an `IncrementalScorer` instead of rebuilding them every turn.
+
+        """
+
+        if objective not in self.OBJECTIVES:
+            raise ValueError('Unknown objective: {}'.format(objective))
+        self.table = table
+        self.n_boards = n_boards
+        self.objective = objective
+        self.scorers = None
+        if incremental:
+            # Boards share the (read only) initial counts; only the live
+            # counts are per board
+            scorer = IncrementalScorer(self.table.table, np.arange(len(self.table.words)),
+                                       self.table.answer_ids, self.table.n_patterns)
+            self.scorers = [copy.copy(scorer) for _ in range(n_boards)]
+        self.reset()
+
+    def reset(self):
+        """Restores the full candidate set on every board.
+
+        """
+
+        self.candidates = [self.table.answer_ids.copy() for _ in range(self.n_boards)]
+        self.solved = np.zeros(self.n_boards, dtype = bool)
+        self.allowed = np.arange(len(self.table.words))
+        if self.scorers is not None:
+            for scorer in self.scorers:
+                scorer.reset()
+
+    @property
+    def word_states(self):
+        """List of remaining candidate answer words per board."""
+        return [self.table.words[candidates] for candidates in self.candidates]
+
+    def calculate_scores(self):
+        """Calculates the joint score of every allowed guess over all unsolved
+        boards.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        guess_ids : np.ndarray
+
+        entropies : np.ndarray
+            Summed entropy over unsolved boards.
+
+        expected_solved : np.ndarray
+            Expected number of unsolved boards the guess solves outright.
+
+        Raises `ValueError` once every board is solved, as does
+        `best_guess`.
+
+        """
+
+        # Nothing left to score once every board is solved
+        if self.solved.all():
+            raise ValueError('Game over; all {} boards are solved'.format(self.n_boards))
+        open_boards = [b for b in range(self.n_boards) if not self.solved[b]]
+        sizes = np.array([len(self.candidates[b]) for b in open_boards])
+        n_patterns = self.table.n_patterns
+        entropies = np.zeros(len(self.allowed))
+        expected_solved = np.zeros(len(self.allowed))
+        with profiler.timer('entropy_scoring'):
+            if self.scorers is not None:
+                # Counts are maintained per board; only refresh entropies
+                for b, size in zip(open_boards, sizes):
+                    entropies += self.scorers[b].entropies()[1]
+                    expected_solved += self.scorers[b].counts[:, self.table.solved_pattern] / size
+            else:
+                candidate_sets = [self.candidates[b] for b in open_boards]
+                def score(chunk):
+                    counts = Scoring.board_pattern_counts(self.table.table, self.allowed[chunk], candidate_sets, n_patterns)
+                    entropies[chunk] = Scoring.entropies(counts.reshape(-1, n_patterns)).reshape(counts.shape[:2]).sum(axis = 1)
+                    # Probability of solving a board is 1/|candidates| when the
+                    # guess is one of its candidates; i.e. the 'correct' bucket
+                    # frequency
+                    expected_solved[chunk] = (counts[:, :, self.table.solved_pattern] / sizes).sum(axis = 1)
+                Scoring.map_chunks(score, len(self.allowed), len(open_boards) * n_patterns)
+        profiler.count('guesses_scored', len(self.allowed) * len(open_boards))
+        return self.allowed, entropies, expected_solved
+
+    def best_guess(self):
+        """Returns the highest scoring guess.
+
+        A board reduced to a single candidate is played immediately; it holds
+        no entropy and would otherwise never be chosen under the 'entropy'
+        objective.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        guess : str
+
+        score : float
+
+        """
+
+        for candidates, solved in zip(self.candidates, self.solved):
+            if not solved and len(candidates) == 1:
+                return self.table.words[candidates[0]], 1.0
+        guess_ids, entropies, expected_solved = self.calculate_scores()
+        if self.objective == 'entropy':
+            primary, secondary = entropies, expected_solved
+        else:
+            primary, secondary = expected_solved, entropies
+        # `np.lexsort` sorts ascending on the last key first
+        best = np.lexsort((-np.round(secondary, 12), -np.round(primary, 12)))[0]
+        return self.table.words[guess_ids[best]], primary[best]
+
+    def apply(self, guess, patterns):
+        """Narrows each unsolved board to candidates consistent with `guess`
+        evaluating to its pattern.
+
+        Parameters
+        ----------
+        guess : str
+
+        patterns : list
+            Pattern id per board; entries of already solved boards are
+            ignored.
+
+        Returns
+        -------
+        None
+
+        """
+
+        with profiler.timer('state_filtering'):
+            row = self.table.table[self.table.index[guess]]
+            for b, pattern in enumerate(patterns):
+                if self.solved[b]:
+                    continue
+                if pattern == self.table.solved_pattern:
+                    self.solved[b] = True
+                matches = row[self.candidates[b]] == pattern
+                removed = self.candidates[b][~matches]
+                self.candidates[b] = self.candidates[b][matches]
+                if self.scorers is not None and not self.solved[b]:
+                    self.scorers[b].update(removed, self.candidates[b])
@@ -0,0 +1,150 @@
+# Import aux libraries
+import os
+import numpy as np
+# Import solver modules
+from Solver import Scoring
+from Solver import Artifacts
+
+# Default locations of the partition index arrays
+IDS_PATH = os.path.join('Data', 'partition_ids.npy')
+OFFSETS_PATH = os.path.join('Data', 'partition_offsets.npy')
+
+
+class PartitionIndex:
+
+    """Compressed-sparse (CSR) layout of the answers each guess and pattern
+    branch to.
+
+    Flat replacement of the old nested `pattern_dict`; for every guess the
+    answer ids are stored sorted by the pattern they evaluate to, alongside
+    an (n_patterns + 1) entry offset array. The answers of a (guess, pattern)
+    bucket are then a contiguous slice, and bucket sizes are offset
+    differences.
+
+        ids[g, offsets[g, p]:offsets[g, p + 1]]
+        >>> answers that evaluate to pattern `p` against guess `g`
+
+    Both arrays are plain `.npy` files and may be memory-mapped, in which
+    case narrowing from the full answer set reads only the touched slice.
+
+    Attributes
+    ----------
+    ids : np.ndarray
+        (guesses, answers) array of answer word ids sorted by pattern.
+
+    offsets : np.ndarray
+        (guesses, n_patterns + 1) array of bucket boundaries.
+
+    """
+
+    def __init__(self, ids, offsets):
+        self.ids = ids
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls, table):
+        """Builds the index from a pattern table.
+
+        Parameters
+        ----------
+        table : PatternTable
+
+        Returns
+        -------
+        index : PartitionIndex
+
+        """
+
+        answer_ids = table.answer_ids
+        # Word ids fit in 16 bits for any vocabulary the table bound allows
+        dtype = np.uint16 if len(table.words) < 2**16 else np.uint32
+        ids = np.empty((len(table.words), len(answer_ids)), dtype = dtype)
+        offsets = np.zeros((len(table.words), table.n_patterns + 1), dtype = np.int32)
+        guess_ids = np.arange(len(table.words))
+        for chunk in Scoring.chunks(len(guess_ids), table.n_patterns):
+            patterns = table.table[np.ix_(guess_ids[chunk], answer_ids)]
+            ids[chunk] = answer_ids[np.argsort(patterns, axis = 1, kind = 'stable')]
+            counts = Scoring.pattern_counts(table.table, guess_ids[chunk], answer_ids, table.n_patterns)
+            offsets[chunk, 1:] = np.cumsum(counts, axis = 1)
+        return cls(ids, offsets)
+
+    @classmethod
+    def load(cls, table, rebuild = False, ids_path = None, offsets_path = None, mmap = True):
+        """Loads index arrays, memory-mapped by default.
+
+        The saved index must carry the stamp of the word lists of `table`
+        (see `Artifacts`); otherwise `StaleArtifactError` is raised unless
+        `rebuild` is set.
+
+        Parameters
+        ----------
+        table : PatternTable
+
+        rebuild : bool
+            Indicate to build and save the index when missing or stale.
+
+        ids_path : str
+
+        offsets_path : str
+
+        mmap : bool
+            Indicate to memory-map the arrays rather than read them.
+
+        Returns
+        -------
+        index : PartitionIndex
+
+        """
+
+        ids_path = ids_path or Artifacts.length_path(IDS_PATH, table.length)
+        offsets_path = offsets_path or Artifacts.length_path(OFFSETS_PATH, table.length)
+        paths = [ids_path, offsets_path]
+        expected = Artifacts.stamp('partition_index', table.words, table.answer_ids, table.length)
+        if rebuild and Artifacts.check(paths, expected) is not None:
+            cls.build(table).save(expected, ids_path, offsets_path)
+        Artifacts.validate(paths, expected)
+        mmap_mode = 'r' if mmap else None
+        return cls(np.load(ids_path, mmap_mode = mmap_mode), np.load(offsets_path, mmap_mode = mmap_mode))
+
+    def save(self, stamp, ids_path = IDS_PATH, offsets_path = OFFSETS_PATH):
+        """Saves index arrays atomically with their stamp.
+
+        """
+
+        Artifacts.save([Artifacts.save_array(ids_path, self.ids), Artifacts.save_array(offsets_path, self.offsets)], stamp)
+
+    def bucket(self, guess_id, pattern):
+        """Returns the answers of a (guess, pattern) bucket as a slice view.
+
+        Parameters
+        ----------
+        guess_id : int
+
+        pattern : int
+
+        Returns
+        -------
+        answers : np.ndarray
+            Zero-copy view into `ids`.
+
+        """
+
+        start, stop = self.offsets[guess_id, pattern], self.offsets[guess_id, pattern + 1]
+        return self.ids[guess_id, start:stop]
+
+    def bucket_sizes(self, guess_ids):
+        """Returns the pattern distribution of guesses over the full answer
+        set.
+
+        Parameters
+        ----------
+        guess_ids : np.ndarray
+
+        Returns
+        -------
+        counts : np.ndarray
+            (guesses, n_patterns) array of bucket sizes.
+
+        """
+
+        return np.diff(self.offsets[guess_ids], axis = 1)
@@ -0,0 +1,415 @@
+# Import aux libraries
+import os
+import numpy as np
+# Import solver modules
+from Solver import Artifacts
+from Solver.Profiler import profiler
+
+# Tile evaluations ordered by their base-3 digit in a pattern id;
+#   -> A pattern is encoded as sum(digit[i] * 3**i) over tile positions
+#   -> All 'correct' (the winning pattern) is therefore 3**L - 1; 242 for
+#      five letter words
+EVALUATIONS = ('absent', 'present', 'correct')
+# Feedback string characters by evaluation digit
+FEEDBACK = {'b' : 0, 'x' : 0, '.' : 0, '0' : 0, 'y' : 1, '1' : 1, 'g' : 2, '2' : 2}
+
+# Supported word lengths
+MIN_LENGTH = 4
+MAX_LENGTH = 8
+
+# Upper bound on the size of a pattern table held in memory;
+#   -> A table over N words takes N**2 bytes (uint8 ids, L <= 5) or
+#      2 * N**2 bytes (uint16 ids, L >= 6). E.g:
+#         L = 5, N = 12972 : ~168 MB
+#         L = 6, N = 15000 : ~450 MB
+#         L = 8, N = 25000 : ~1.25 GB
+#   -> Larger vocabularies must be trimmed rather than silently swapped
+MAX_TABLE_BYTES = 2 * 1024**3
+
+# Default locations of word lists and the precomputed pattern table
+ANSWERS_PATH = os.path.join('Data', 'wordle-answers.txt')
+GUESSES_PATH = os.path.join('Data', 'wordle-guesses.txt')
+TABLE_PATH = os.path.join('Data', 'pattern_table.npy')
+
+
+def data_paths(length = 5):
+    """Returns default answer list, guess list and table paths for words of
+    `length` letters.
+
+    Five letter words use the original Wordle lists; other lengths are read
+    from files suffixed by their length, e.g. 'Data/wordle-answers-6.txt'.
+
+    Parameters
+    ----------
+    length : int
+
+    Returns
+    -------
+    paths : tuple
+        (answers path, guesses path, table path)
+
+    """
+
+    return tuple(Artifacts.length_path(path, length) for path in (ANSWERS_PATH, GUESSES_PATH, TABLE_PATH))
+
+
+def pattern_dtype(length):
+    """Returns the smallest unsigned dtype holding all 3**`length` pattern ids.
+
+    Parameters
+    ----------
+    length : int
+
+    Returns
+    -------
+    dtype : np.dtype
+
+    """
+
+    return np.dtype(np.uint8) if 3**length <= 2**8 else np.dtype(np.uint16)
+
+
+def table_nbytes(n_words, length):
+    """Returns the memory in bytes of a square pattern table.
+
+    Parameters
+    ----------
+    n_words : int
+
+    length : int
+
+    Returns
+    -------
+    nbytes : int
+
+    """
+
+    return n_words**2 * pattern_dtype(length).itemsize
+
+
+def encode_pattern(evals):
+    """Encodes a sequence of tile evaluations into an integer pattern id.
+
+        encode_pattern(['absent', 'absent', 'correct', 'present', 'present'])
+        >>> 126
+
+    Parameters
+    ----------
+    evals : iterable
+        Tile evaluations, each one of {'correct', 'present', 'absent'}.
+
+    Returns
+    -------
+    pattern : int
+
+    """
+
+    pattern = 0
+    for i, eval in enumerate(evals):
+        pattern += EVALUATIONS.index(eval) * 3**i
+    return pattern
+
+
+def parse_feedback(feedback):
+    """Encodes a feedback string into an integer pattern id.
+
+    Each character is one tile: 'g' or '2' correct, 'y' or '1' present and
+    'b', 'x', '.' or '0' absent (case insensitive).
+
+        parse_feedback('bbgyy')
+        >>> 126
+
+    Parameters
+    ----------
+    feedback : str
+
+    Returns
+    -------
+    pattern : int
+
+    """
+
+    pattern = 0
+    for i, tile in enumerate(feedback.lower()):
+        if tile not in FEEDBACK:
+            raise ValueError('Unknown feedback tile {!r} in {!r}'.format(tile, feedback))
+        pattern += FEEDBACK[tile] * 3**i
+    return pattern
+
+
+def decode_pattern(pattern, length = 5):
+    """Decodes an integer pattern id back into tile evaluations.
+
+    Parameters
+    ----------
+    pattern : int
+
+    length : int
+        Number of tiles in the pattern.
+
+    Returns
+    -------
+    evals : tuple
+
+    """
+
+    evals = []
+    for _ in range(length):
+        pattern, digit = divmod(int(pattern), 3)
+        evals.append(EVALUATIONS[digit])
+    return tuple(evals)
+
+
+def pattern_match(attempt, target):
+    """Makes character wise comparison of `attempt` against `target` and
+    returns the pattern id Wordle would evaluate to.
+
+        decode_pattern(pattern_match('rural', 'larva'))
+        >>> ('absent', 'absent', 'correct', 'present', 'present')
+
+        Import note on REPEAT letters attempts:
+            Case (1) : Repeated letter is PRESENT only once
+            -> First occurence is marked PRESENT, excess is marked ABSENT
+            Case (2) : Repeated letter is CORRECT only once
+            -> Excess is marked ABSENT
+            Case (3) : Repeated letter is both CORRECT and PRESENT
+            -> Excess is marked PRESENT
+
+    Parameters
+    ----------
+    attempt : str
+
+    target : str
+        Word to pattern match against.
+
+    Returns
+    -------
+    pattern : int
+
+    """
+
+    # First pass; mark CORRECT letters and count the letters of `target` that
+    # did not match
+    #   -> Only unmatched letters of `target` can make a letter PRESENT
+    digits = [0] * len(attempt)
+    counts = {}
+    for i, (a, t) in enumerate(zip(attempt, target)):
+        if a == t:
+            digits[i] = 2
+        else:
+            counts[t] = counts.get(t, 0) + 1
+    # Second pass; mark PRESENT letters left to right
+    #   -> Excess repeats of a letter are left ABSENT
+    for i, a in enumerate(attempt):
+        if digits[i] == 0 and counts.get(a, 0) > 0:
+            digits[i] = 1
+            counts[a] -= 1
+    return sum(digit * 3**i for i, digit in enumerate(digits))
+
+
+def word_codes(words):
+    """Returns a (words, length) integer array of character codes.
+
+    Parameters
+    ----------
+    words : np.ndarray
+        Array of equal length words.
+
+    Returns
+    -------
+    codes : np.ndarray
+
+    """
+
+    words = np.asarray(words, dtype = str)
+    length = words.dtype.itemsize // 4
+    return np.ascontiguousarray(words).view(np.uint32).reshape(len(words), length)
+
+
+def compute_patterns(guesses, targets, chunk = 256):
+    """Computes the pattern id of every guess against every target.
+
+    The computation is vectorized over targets and over chunks of `chunk`
+    guesses at a time, so memory use is bounded by `chunk * len(targets)`
+    intermediate entries regardless of the vocabulary size.
+
+    Parameters
+    ----------
+    guesses : np.ndarray
+        Array of words to guess with (rows).
+
+    targets : np.ndarray
+        Array of words to match against (columns).
+
+    chunk : int
+        Number of guesses evaluated per vectorized step.
+
+    Returns
+    -------
+    table : np.ndarray
+        (guesses, targets) array of pattern ids; uint8 up to five letters,
+        uint16 beyond.
+
+    """
+
+    G = word_codes(guesses)
+    T = word_codes(targets)
+    length = G.shape[1]
+    table = np.empty((len(G), len(T)), dtype = pattern_dtype(length))
+    for start in range(0, len(G), chunk):
+        g = G[start:start + chunk]
+        # CORRECT letters; (chunk, targets, length)
+        green = g[:, None, :] == T[None, :, :]
+        pattern = np.zeros((len(g), len(T)), dtype = np.int16)
+        for i in range(length):
+            # Number of unmatched letters in target equal to guess letter `i`
+            available = np.zeros((len(g), len(T)), dtype = np.int8)
+            for j in range(length):
+                available += (T[None, :, j] == g[:, None, i]) & ~green[:, :, j]
+            # Number of earlier unmatched occurences of the same guess letter;
+            #   -> These claim the available letters first (left to right)
+            claimed = np.zeros_like(available)
+            for j in range(i):
+                claimed += (g[:, None, j] == g[:, None, i]) & ~green[:, :, j]
+            yellow = ~green[:, :, i] & (claimed < available)
+            pattern += (2 * green[:, :, i] + yellow) * 3**i
+        table[start:start + chunk] = pattern
+    return table
+
+
+class PatternTable:
+
+    """Precomputed pattern ids between every pair of words in the vocabulary.
+
+    The vocabulary is the sorted union of allowed guesses and answers; the
+    table is square so that it can narrow both the candidate answers and (in
+    hard mode) the allowed guesses with the same row lookup.
+
+    Attributes
+    ----------
+    words : np.ndarray
+        Vocabulary of allowed guesses.
+
+    length : int
+        Number of letters per word.
+
+    n_patterns : int
+        Number of distinct pattern ids; 3**length.
+
+    solved_pattern : int
+        Pattern id of an all 'correct' evaluation.
+
+    answer_ids : np.ndarray
+        Indices into `words` of the possible answers.
+
+    table : np.ndarray
+        (words, words) array where `table[g, t]` is the pattern id of guessing
+        `words[g]` against `words[t]`.
+
+    index : dict
+        Key : word, value : index into `words`.
+
+    """
+
+    def __init__(self, words, answer_ids, table):
+        self.words = words
+        self.answer_ids = answer_ids
+        self.table = table
+        self.index = {word:i for i, word in enumerate(words)}
+        self.length = words.dtype.itemsize // 4
+        self.n_patterns = 3**self.length
+        self.solved_pattern = self.n_patterns - 1
+
+    @staticmethod
+    def load_words(length = 5):
+        """Loads the vocabulary and answers of `length` letter words.
+
+        Parameters
+        ----------
+        length : int
+            Number of letters per word; between `MIN_LENGTH` and `MAX_LENGTH`.
+
+        Returns
+        -------
+        words : np.ndarray
+            Sorted union of answers and allowed guesses.
+
+        answer_ids : np.ndarray
+            Indices into `words` of the answers.
+
+        """
+
+        if not MIN_LENGTH <= length <= MAX_LENGTH:
+            raise ValueError('Word length must be between {} and {}'.format(MIN_LENGTH, MAX_LENGTH))
+        answers_path, guesses_path, _ = data_paths(length)
+        # Keep words of requested length only
+        answers = np.loadtxt(answers_path, dtype = str)
+        guesses = np.loadtxt(guesses_path, dtype = str)
+        answers = answers[np.char.str_len(answers) == length]
+        guesses = guesses[np.char.str_len(guesses) == length]
+        words = np.union1d(answers, guesses)
+        return words, np.searchsorted(words, answers)
+
+    @classmethod
+    def load(cls, length = 5, compute = False, save = True, path = None):
+        """Loads word lists and pattern table from `Data`.
+
+        The saved table carries a stamp of the word lists, word length and
+        format version it was built from (see `Artifacts`); a missing or
+        mismatched table raises `StaleArtifactError` rather than being
+        silently recomputed.
+
+        Parameters
+        ----------
+        length : int
+            Number of letters per word; between `MIN_LENGTH` and `MAX_LENGTH`.
+
+        compute : bool
+            Indicate to compute the pattern table rather than load it.
+
+        save : bool
+            Indicate to save a computed pattern table (atomically, with its
+            stamp) to `path`.
+
+        path : str
+            Table location; defaults to the table path for `length`.
+
+        Returns
+        -------
+        table : PatternTable
+
+        """
+
+        words, answer_ids = cls.load_words(length)
+        path = path or data_paths(length)[2]
+        expected = Artifacts.stamp('pattern_table', words, answer_ids, length)
+        # Refuse vocabularies whose table would not fit the memory bound
+        nbytes = table_nbytes(len(words), length)
+        if nbytes > MAX_TABLE_BYTES:
+            raise MemoryError('Pattern table of {} words needs {:.2f} GB; bound is {:.2f} GB'.format(
+                len(words), nbytes / 1024**3, MAX_TABLE_BYTES / 1024**3))
+        if compute:
+            with profiler.timer('table_compute'):
+                table = compute_patterns(words, words)
+            if save:
+                Artifacts.save([Artifacts.save_array(path, table)], expected)
+        else:
+            Artifacts.validate([path], expected)
+            with profiler.timer('table_load'):
+                table = np.load(path)
+        return cls(words, answer_ids, table)
+
+    def word_ids(self, words):
+        """Returns vocabulary indices of `words`.
+
+        Parameters
+        ----------
+        words : iterable
+
+        Returns
+        -------
+        ids : np.ndarray
+
+        """
+
+        return np.array([self.index[word] for word in words], dtype = np.intp)
@@ -0,0 +1,226 @@
+# Import aux libraries
+import json
+import time
+from collections import defaultdict
+
+
+class Timer:
+
+    """Context manager adding its elapsed time to a named profiler timer.
+
+    Returned by `Profiler.timer`; does nothing while the profiler is
+    disabled beyond one attribute check on enter and exit.
+
+    """
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        if self.profiler.enabled:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.start is not None:
+            self.profiler.add_time(self.name, time.perf_counter() - self.start)
+            self.start = None
+        return False
+
+
+class Profiler:
+
+    """Lightweight timers and counters around the hot paths of the bots and
+    solvers.
+
+    Instrumentation is off by default and can be switched on and off at
+    runtime. Measurements accumulate for the current game until `end_game`
+    is called, after which they are kept as a per-game record and folded
+    into the aggregate.
+
+    Methods
+    -------
+    enable() / disable()
+        Switches instrumentation on or off.
+
+    timer(name)
+        Context manager timing a block under `name`.
+
+    count(name, n)
+        Increments counter `name` by `n`.
+
+    end_game()
+        Closes the current game record.
+
+    report()
+        Returns per-game and aggregate measurements as a dictionary.
+
+    to_json() / to_prometheus()
+        Serializes the report.
+
+    """
+
+    def __init__(self, enabled = False):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        """Discards all recorded measurements.
+
+        """
+
+        self.games = []
+        self.__new_game()
+
+    def __new_game(self):
+        # Timers : name -> [seconds, calls]; counters : name -> count
+        self.timers = defaultdict(lambda: [0.0, 0])
+        self.counters = defaultdict(int)
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def timer(self, name):
+        """Returns a context manager timing a block under `name`.
+
+        Parameters
+        ----------
+        name : str
+
+        Returns
+        -------
+        timer : Timer
+
+        """
+
+        return Timer(self, name)
+
+    def add_time(self, name, seconds):
+        """Adds `seconds` to timer `name` and increments its call count.
+
+        """
+
+        if self.enabled:
+            timer = self.timers[name]
+            timer[0] += seconds
+            timer[1] += 1
+
+    def count(self, name, n = 1):
+        """Increments counter `name` by `n`.
+
+        """
+
+        if self.enabled:
+            self.counters[name] += n
+
+    def end_game(self):
+        """Closes the current game record and starts a new one.
+
+        Nothing is recorded when no measurements were taken.
+
+        """
+
+        if self.timers or self.counters:
+            self.games.append(self.__snapshot(self.timers, self.counters))
+        self.__new_game()
+
+    @staticmethod
+    def __snapshot(timers, counters):
+        return {
+            'timers' : {name:{'seconds' : seconds, 'calls' : calls} for name, (seconds, calls) in sorted(timers.items())},
+            'counters' : dict(sorted(counters.items()))
+        }
+
+    def report(self):
+        """Returns per-game and aggregate measurements.
+
+        The aggregate covers all closed games plus the game in progress.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        report : dict
+
+        """
+
+        timers = defaultdict(lambda: [0.0, 0])
+        counters = defaultdict(int)
+        records = self.games + [self.__snapshot(self.timers, self.counters)]
+        for record in records:
+            for name, timer in record['timers'].items():
+                timers[name][0] += timer['seconds']
+                timers[name][1] += timer['calls']
+            for name, n in record['counters'].items():
+                counters[name] += n
+        return {
+            'games' : self.games,
+            'aggregate' : dict(self.__snapshot(timers, counters), games = len(self.games))
+        }
+
+    def to_json(self, **kwargs):
+        """Serializes `report()` as JSON.
+
+        """
+
+        return json.dumps(self.report(), **kwargs)
+
+    def to_prometheus(self, prefix = 'wordle'):
+        """Serializes the aggregate of `report()` in Prometheus text format.
+
+        Parameters
+        ----------
+        prefix : str
+            Metric name prefix.
+
+        Returns
+        -------
+        text : str
+
+        """
+
+        aggregate = self.report()['aggregate']
+        lines = [
+            '# HELP {}_games_total Completed games.'.format(prefix),
+            '# TYPE {}_games_total counter'.format(prefix),
+            '{}_games_total {}'.format(prefix, aggregate['games']),
+            '# HELP {}_timer_seconds_total Time spent per instrumented section.'.format(prefix),
+            '# TYPE {}_timer_seconds_total counter'.format(prefix)
+        ]
+        for name, timer in aggregate['timers'].items():
+            lines.append('{}_timer_seconds_total{{section="{}"}} {!r}'.format(prefix, name, timer['seconds']))
+        lines += [
+            '# HELP {}_timer_calls_total Calls per instrumented section.'.format(prefix),
+            '# TYPE {}_timer_calls_total counter'.format(prefix)
+        ]
+        for name, timer in aggregate['timers'].items():
+            lines.append('{}_timer_calls_total{{section="{}"}} {}'.format(prefix, name, timer['calls']))
+        lines += [
+            '# HELP {}_events_total Instrumented event counts.'.format(prefix),
+            '# TYPE {}_events_total counter'.format(prefix)
+        ]
+        for name, n in aggregate['counters'].items():
+            lines.append('{}_events_total{{event="{}"}} {}'.format(prefix, name, n))
+        return '\n'.join(lines) + '\n'
+
+
+# Shared instance used by bots and solvers
+profiler = Profiler()
+
+
+def sleep(seconds):
+    """Timed drop-in for `time.sleep`; recorded under the 'sleep' timer.
+
+    """
+
+    with profiler.timer('sleep'):
+        time.sleep(seconds)
@@ -0,0 +1,407 @@
+# Import aux libraries
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of distinct patterns a five letter guess can evaluate to
+N_PATTERNS = 3**5
+
+# Upper bound on histogram bins (guesses * patterns) built per vectorized step;
+#   -> Keeps the count matrix at ~32 MB even for 3**8 = 6561 patterns, where
+#      all guesses at once would need hundreds of MB
+MAX_BINS = 2**22
+
+# Default number of threads scoring chunks of the guess axis;
+#   -> NumPy releases the GIL inside the table gather, `np.bincount` and the
+#      log kernels, so threads work on one shared copy of the table without
+#      the pickling of a process pool
+THREADS = 1
+# Thread pools by size; created on first use and reused across moves
+pools = {}
+# Tables of c * log(c) for integer counts c by dtype; grown on demand
+xlogx_tables = {}
+
+
+def set_threads(threads):
+    """Sets the default number of scoring threads.
+
+    Parameters
+    ----------
+    threads : int
+
+    Returns
+    -------
+    None
+
+    """
+
+    global THREADS
+    THREADS = max(1, int(threads))
+
+
+def chunks(n_guesses, n_bins, threads = 1):
+    """Yields slices splitting `n_guesses` guesses into steps of at most
+    `MAX_BINS` histogram bins, and into at least `threads` steps.
+
+    Parameters
+    ----------
+    n_guesses : int
+
+    n_bins : int
+        Number of bins per guess.
+
+    threads : int
+
+    Returns
+    -------
+    slices : generator
+
+    """
+
+    # Guesses without bins (e.g. no candidates) fit in a single step
+    step = max(1, MAX_BINS // max(n_bins, 1))
+    if threads > 1:
+        step = min(step, max(1, -(-n_guesses // threads)))
+    for start in range(0, n_guesses, step):
+        yield slice(start, start + step)
+
+
+def map_chunks(fn, n_guesses, n_bins, threads = None):
+    """Applies `fn` to every chunk of the guess axis, in a thread pool when
+    more than one thread is configured.
+
+    Parameters
+    ----------
+    fn : callable
+        Called with a slice of the guess axis.
+
+    n_guesses : int
+
+    n_bins : int
+        Number of bins per guess.
+
+    threads : int
+        Number of threads; defaults to `THREADS`.
+
+    Returns
+    -------
+    results : list
+        Results of `fn` in chunk order.
+
+    """
+
+    threads = THREADS if threads is None else threads
+    slices = list(chunks(n_guesses, n_bins, threads))
+    if threads <= 1 or len(slices) == 1:
+        return [fn(chunk) for chunk in slices]
+    if threads not in pools:
+        pools[threads] = ThreadPoolExecutor(max_workers = threads)
+    return list(pools[threads].map(fn, slices))
+
+
+def rank(scores, priority = None, secondary = None):
+    """Returns positions of `scores` from best (highest) to worst.
+
+    Scores are compared to 12 decimals so that float noise does not hide
+    ties; ties are broken by higher `secondary` scores, then in favour of
+    `priority`.
+
+    Parameters
+    ----------
+    scores : np.ndarray
+
+    priority : np.ndarray
+        Optional boolean tie-break; e.g. whether a guess may be the answer.
+
+    secondary : np.ndarray
+        Optional secondary scores.
+
+    Returns
+    -------
+    order : np.ndarray
+
+    """
+
+    if priority is None:
+        priority = np.zeros(len(scores), dtype = bool)
+    if secondary is None:
+        secondary = np.zeros(len(scores))
+    # `np.lexsort` sorts ascending on the last key first
+    return np.lexsort((~priority, -np.round(secondary, 12), -np.round(scores, 12)))
+
+
+def pattern_counts(table, guess_ids, candidate_ids, n_patterns = N_PATTERNS):
+    """Builds the distribution over patterns of every guess against the
+    current candidates.
+
+    One gather from the pattern table and one `np.bincount` over all guesses
+    at once; each guess' row is offset into its own block of `n_patterns`
+    bins.
+
+    Parameters
+    ----------
+    table : np.ndarray
+        (words, words) pattern table.
+
+    guess_ids : np.ndarray
+        Indices of guesses to score.
+
+    candidate_ids : np.ndarray
+        Indices of remaining candidate answers.
+
+    n_patterns : int
+
+    Returns
+    -------
+    counts : np.ndarray
+        (guesses, n_patterns) array of pattern frequencies.
+
+    """
+
+    patterns = table[np.ix_(guess_ids, candidate_ids)]
+    offsets = np.arange(len(guess_ids))[:, None] * n_patterns
+    counts = np.bincount((patterns + offsets).ravel(), minlength = len(guess_ids) * n_patterns)
+    return counts.reshape(len(guess_ids), n_patterns)
+
+
+def xlogx(n, dtype = np.float64):
+    """Returns a lookup table of c * log(c) for integer counts 0 <= c <= n.
+
+    Tables are cached per dtype and grown to the next power of two, so one
+    table serves every candidate set size seen so far.
+
+    Parameters
+    ----------
+    n : int
+        Largest count to cover.
+
+    dtype : np.dtype
+
+    Returns
+    -------
+    table : np.ndarray
+        Entry c holds c * log(c), with 0 * log(0) = 0.
+
+    """
+
+    table = xlogx_tables.get(np.dtype(dtype))
+    if table is None or len(table) <= n:
+        c = np.arange(1 << int(n).bit_length(), dtype = np.float64)
+        table = np.zeros(len(c), dtype = dtype)
+        table[1:] = c[1:] * np.log(c[1:])
+        # Replaced rather than resized, so concurrent readers keep a valid table
+        xlogx_tables[np.dtype(dtype)] = table
+    return table
+
+
+def entropies(counts, dtype = np.float64):
+    """Calculates the entropy of each row of pattern frequencies.
+
+    Counts are integers, so with N the row total
+
+        H = log(N) - sum(c * log(c)) / N
+
+    is evaluated from an `xlogx` lookup indexed by the counts; zero buckets
+    contribute a table zero instead of a log. The only temporary is one
+    gathered block per call. float32 halves the memory traffic and is
+    accurate to about 1e-6 nats; the default float64 keeps scores exact
+    enough for the 12 decimal comparisons of `rank`.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        (guesses, n_patterns) array of pattern frequencies.
+
+    dtype : np.dtype
+        Float type of the lookup and the sums.
+
+    Returns
+    -------
+    entropies : np.ndarray
+        Entropies in nats; NaN for rows without counts.
+
+    """
+
+    totals = counts.sum(axis = 1, dtype = np.int64)
+    table = xlogx(totals.max(initial = 0), dtype)
+    sums = np.take(table, counts).sum(axis = 1, dtype = dtype)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        totals = totals.astype(dtype)
+        return np.log(totals) - sums / totals
+
+
+def guess_entropies(table, guess_ids, candidate_ids, n_patterns = N_PATTERNS, threads = None):
+    """Calculates the entropy of every guess over the current candidates.
+
+    Guesses are histogrammed in chunks bounded by `MAX_BINS`, so memory stays
+    flat as the number of patterns grows with word length. Chunks are scored
+    by `threads` threads.
+
+    Parameters
+    ----------
+    table : np.ndarray
+        (words, words) pattern table.
+
+    guess_ids : np.ndarray
+        Indices of guesses to score.
+
+    candidate_ids : np.ndarray
+        Indices of remaining candidate answers.
+
+    n_patterns : int
+
+    threads : int
+        Number of threads; defaults to `THREADS`.
+
+    Returns
+    -------
+    entropies : np.ndarray
+
+    """
+
+    scores = np.empty(len(guess_ids))
+    def score(chunk):
+        scores[chunk] = entropies(pattern_counts(table, guess_ids[chunk], candidate_ids, n_patterns))
+    map_chunks(score, len(guess_ids), n_patterns, threads)
+    return scores
+
+
+def top_entropies(table, guess_ids, candidate_ids, k, n_patterns = N_PATTERNS, threads = None, priority = None):
+    """Returns the `k` highest entropy guesses over the current candidates.
+
+    Each chunk of the guess axis keeps only its own top `k`; the per-chunk
+    winners are merged at the end, so no full score vector is shared
+    between threads.
+
+    Parameters
+    ----------
+    table : np.ndarray
+        (words, words) pattern table.
+
+    guess_ids : np.ndarray
+        Indices of guesses to score.
+
+    candidate_ids : np.ndarray
+        Indices of remaining candidate answers.
+
+    k : int
+
+    n_patterns : int
+
+    threads : int
+        Number of threads; defaults to `THREADS`.
+
+    priority : np.ndarray
+        Optional boolean tie-break over guesses; see `rank`.
+
+    Returns
+    -------
+    positions : np.ndarray
+        Positions in `guess_ids` of the best guesses, best first.
+
+    entropies : np.ndarray
+
+    """
+
+    if priority is None:
+        priority = np.zeros(len(guess_ids), dtype = bool)
+    def best(chunk):
+        scores = entropies(pattern_counts(table, guess_ids[chunk], candidate_ids, n_patterns))
+        order = rank(scores, priority[chunk])[:k]
+        return np.arange(len(guess_ids))[chunk][order], scores[order]
+    results = map_chunks(best, len(guess_ids), n_patterns, threads)
+    positions = np.concatenate([positions for positions, _ in results])
+    scores = np.concatenate([scores for _, scores in results])
+    order = rank(scores, priority[positions])[:k]
+    return positions[order], scores[order]
+
+
+def top_minimax(table, guess_ids, candidate_ids, k, n_patterns = N_PATTERNS, threads = None, priority = None):
+    """Returns the `k` guesses whose largest pattern bucket over the current
+    candidates is smallest.
+
+    Shares the chunked histogram path of `top_entropies`; the worst case is
+    the maximum of each count row, with entropy breaking ties.
+
+    Parameters
+    ----------
+    table : np.ndarray
+        (words, words) pattern table.
+
+    guess_ids : np.ndarray
+        Indices of guesses to score.
+
+    candidate_ids : np.ndarray
+        Indices of remaining candidate answers.
+
+    k : int
+
+    n_patterns : int
+
+    threads : int
+        Number of threads; defaults to `THREADS`.
+
+    priority : np.ndarray
+        Optional boolean tie-break over guesses; see `rank`.
+
+    Returns
+    -------
+    positions : np.ndarray
+        Positions in `guess_ids` of the best guesses, best first.
+
+    worst_cases : np.ndarray
+        Size of the largest bucket of each guess.
+
+    entropies : np.ndarray
+
+    """
+
+    if priority is None:
+        priority = np.zeros(len(guess_ids), dtype = bool)
+    def best(chunk):
+        counts = pattern_counts(table, guess_ids[chunk], candidate_ids, n_patterns)
+        worst, scores = counts.max(axis = 1), entropies(counts)
+        order = rank(-worst, priority[chunk], scores)[:k]
+        return np.arange(len(guess_ids))[chunk][order], worst[order], scores[order]
+    results = map_chunks(best, len(guess_ids), n_patterns, threads)
+    positions, worst, scores = (np.concatenate(values) for values in zip(*results))
+    order = rank(-worst, priority[positions], scores)[:k]
+    return positions[order], worst[order], scores[order]
+
+
+def board_pattern_counts(table, guess_ids, candidate_sets, n_patterns = N_PATTERNS):
+    """Builds the distribution over patterns of every guess against the
+    candidates of several independent boards.
+
+    Candidates of all boards are concatenated so that a single gather from
+    the pattern table and a single `np.bincount` serve every board; each
+    (guess, board) pair is offset into its own block of `n_patterns` bins.
+    Cost grows with the total number of candidates, not with the number of
+    boards.
+
+    Parameters
+    ----------
+    table : np.ndarray
+        (words, words) pattern table.
+
+    guess_ids : np.ndarray
+        Indices of guesses to score.
+
+    candidate_sets : list
+        Arrays of candidate answer indices; one per board.
+
+    n_patterns : int
+
+    Returns
+    -------
+    counts : np.ndarray
+        (guesses, boards, n_patterns) array of pattern frequencies.
+
+    """
+
+    n_boards = len(candidate_sets)
+    candidate_ids = np.concatenate(candidate_sets)
+    boards = np.repeat(np.arange(n_boards), [len(c) for c in candidate_sets])
+    patterns = table[np.ix_(guess_ids, candidate_ids)]
+    offsets = np.arange(len(guess_ids))[:, None] * (n_boards * n_patterns) + boards * n_patterns
+    counts = np.bincount((patterns + offsets).ravel(), minlength = len(guess_ids) * n_boards * n_patterns)
+    return counts.reshape(len(guess_ids), n_boards, n_patterns)
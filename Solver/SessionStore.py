@@ -0,0 +1,235 @@
+# Import aux libraries
+import time
+import struct
+import numpy as np
+from collections import OrderedDict
+# Import solver modules
+from Solver.Profiler import profiler
+
+# Packed move; guess word id and pattern id as little-endian uint16
+MOVE = struct.Struct('<HH')
+
+
+class Session:
+
+    """Compact per-game record.
+
+    Attributes
+    ----------
+    moves : bytes
+        Packed (guess id, pattern id) moves; 4 bytes each.
+
+    bits : bytes
+        Packed candidate bitset over the answer list; `None` when the store
+        reconstructs candidates from `moves`.
+
+    last_seen : float
+        Time of last access; drives idle eviction.
+
+    """
+
+    __slots__ = ('moves', 'bits', 'last_seen')
+
+    def __init__(self, bits = None):
+        self.moves = b''
+        self.bits = bits
+        self.last_seen = time.monotonic()
+
+
+class SessionStore:
+
+    """Store of concurrent game sessions with O(1) lookup and LRU eviction.
+
+    Sessions hold only their packed move history and, optionally, a packed
+    bitset of the remaining answers:
+
+        -> history mode : ~60 B record + 4 B per move; candidates are
+                          rebuilt lazily by replaying the moves
+        -> bitset mode  : additionally ceil(answers / 8) B (290 B for the
+                          2,315 Wordle answers); candidates are read directly
+
+    Either way a session costs well under 1 KB, including its entry in the
+    store.
+
+    Methods
+    -------
+    create(session_id)
+        Starts a new session.
+
+    record(session_id, guess, pattern)
+        Appends a move to a session.
+
+    history(session_id)
+        Returns the moves of a session.
+
+    candidates(session_id)
+        Returns the remaining candidate answer ids of a session.
+
+    remove(session_id)
+        Drops a session.
+
+    evict_idle(max_idle)
+        Drops sessions idle for longer than `max_idle` seconds.
+
+    """
+
+    def __init__(self, table, capacity = 1000000, bitsets = False):
+        """Constructs empty store.
+
+        Attributes
+        ----------
+        table : PatternTable
+
+        capacity : int
+            Maximum number of live sessions; the least recently used session
+            is evicted beyond it.
+
+        bitsets : bool
+            Indicate to keep a packed candidate bitset per session rather
+            than replaying its moves on demand.
+
+        """
+
+        if len(table.words) >= 2**16:
+            raise ValueError('Word ids must fit 16 bits')
+        self.table = table
+        self.capacity = capacity
+        self.bitsets = bitsets
+        self.sessions = OrderedDict()
+        # Bitset of the full answer list
+        self.full_bits = np.packbits(np.ones(len(table.answer_ids), dtype = bool)).tobytes()
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def __contains__(self, session_id):
+        return session_id in self.sessions
+
+    def __get(self, session_id):
+        # Lookup marks the session as most recently used
+        session = self.sessions[session_id]
+        self.sessions.move_to_end(session_id)
+        session.last_seen = time.monotonic()
+        return session
+
+    def create(self, session_id):
+        """Starts a new session, replacing any with the same id.
+
+        Parameters
+        ----------
+        session_id : hashable
+
+        Returns
+        -------
+        None
+
+        """
+
+        self.sessions[session_id] = Session(self.full_bits if self.bitsets else None)
+        self.sessions.move_to_end(session_id)
+        while len(self.sessions) > self.capacity:
+            self.sessions.popitem(last = False)
+            profiler.count('sessions_evicted')
+
+    def record(self, session_id, guess, pattern):
+        """Appends a move to a session, creating the session if needed.
+
+        Parameters
+        ----------
+        session_id : hashable
+
+        guess : str
+
+        pattern : int
+
+        Returns
+        -------
+        None
+
+        """
+
+        if session_id not in self.sessions:
+            self.create(session_id)
+        session = self.__get(session_id)
+        guess_id = self.table.index[guess]
+        session.moves += MOVE.pack(guess_id, pattern)
+        if session.bits is not None:
+            mask = np.unpackbits(np.frombuffer(session.bits, dtype = np.uint8), count = len(self.table.answer_ids)).astype(bool)
+            mask &= self.table.table[guess_id, self.table.answer_ids] == pattern
+            session.bits = np.packbits(mask).tobytes()
+
+    def history(self, session_id):
+        """Returns the moves of a session.
+
+        Parameters
+        ----------
+        session_id : hashable
+
+        Returns
+        -------
+        moves : list
+            (guess, pattern id) tuples in play order.
+
+        """
+
+        session = self.__get(session_id)
+        return [(str(self.table.words[guess_id]), pattern) for guess_id, pattern in MOVE.iter_unpack(session.moves)]
+
+    def candidates(self, session_id):
+        """Returns the remaining candidate answer ids of a session.
+
+        Parameters
+        ----------
+        session_id : hashable
+
+        Returns
+        -------
+        candidates : np.ndarray
+            Indices into the table vocabulary.
+
+        """
+
+        session = self.__get(session_id)
+        answer_ids = self.table.answer_ids
+        if session.bits is not None:
+            mask = np.unpackbits(np.frombuffer(session.bits, dtype = np.uint8), count = len(answer_ids)).astype(bool)
+            return answer_ids[mask]
+        # Lazy reconstruction; replay moves from the full answer set
+        candidates = answer_ids
+        for guess_id, pattern in MOVE.iter_unpack(session.moves):
+            candidates = candidates[self.table.table[guess_id, candidates] == pattern]
+        return candidates
+
+    def remove(self, session_id):
+        """Drops a session if present.
+
+        """
+
+        self.sessions.pop(session_id, None)
+
+    def evict_idle(self, max_idle):
+        """Drops sessions idle for longer than `max_idle` seconds.
+
+        Sessions are kept in access order, so only the stale head of the
+        store is visited.
+
+        Parameters
+        ----------
+        max_idle : float
+
+        Returns
+        -------
+        evicted : int
+
+        """
+
+        cutoff = time.monotonic() - max_idle
+        evicted = 0
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+            if session.last_seen >= cutoff:
+                break
+            del self.sessions[session_id]
+            evicted += 1
+        profiler.count('sessions_evicted', evicted)
+        return evicted
@@ -0,0 +1,129 @@
+# Import aux libraries
+import sys
+import json
+import time
+import argparse
+from itertools import islice
+# Import solver modules
+from Solver import Artifacts
+from Solver.PatternTable import PatternTable, parse_feedback
+from Solver.PartitionIndex import PartitionIndex
+from Solver.EntropySolver import EntropySolver
+
+
+def parse_request(request, table):
+    """Parses one decoded request into a history of (guess, pattern id)
+    moves.
+
+        {"id": 7, "guesses": ["soare", "clint"], "feedback": ["bybbb", "bgbbg"]}
+
+    Feedback is given as strings (see `parse_feedback`) or integer pattern
+    ids.
+
+    Parameters
+    ----------
+    request : dict
+
+    table : PatternTable
+
+    Returns
+    -------
+    history : list
+
+    """
+
+    if not isinstance(request, dict):
+        raise ValueError('Request must be a JSON object')
+    guesses, feedback = request.get('guesses', []), request.get('feedback', [])
+    if not isinstance(guesses, list) or not isinstance(feedback, list):
+        raise ValueError("'guesses' and 'feedback' must be lists")
+    if len(guesses) != len(feedback):
+        raise ValueError('Got {} guesses but {} feedback entries'.format(len(guesses), len(feedback)))
+    history = []
+    for guess, tiles in zip(guesses, feedback):
+        if not isinstance(guess, str) or guess.lower() not in table.index:
+            raise ValueError('Unknown guess {!r}'.format(guess))
+        if isinstance(tiles, str):
+            if len(tiles) != table.length:
+                raise ValueError('Feedback {!r} is not {} tiles'.format(tiles, table.length))
+            tiles = parse_feedback(tiles)
+        # bool is an int subclass, but not a pattern id
+        elif not isinstance(tiles, int) or isinstance(tiles, bool):
+            raise ValueError('Feedback {!r} is neither a string nor an integer pattern id'.format(tiles))
+        if not 0 <= tiles < table.n_patterns:
+            raise ValueError('Pattern id {} out of range'.format(tiles))
+        history.append((guess.lower(), tiles))
+    return history
+
+
+def solve(lines, solver, batch = 10000):
+    """Suggests next guesses for a stream of JSONL requests.
+
+    Requests are read and answered `batch` lines at a time, so memory is
+    bounded by the batch rather than the input; within a batch, identical
+    states are scored once (see `EntropySolver.suggest_many`). Malformed
+    lines yield an 'error' response instead of stopping the stream.
+
+    Parameters
+    ----------
+    lines : iterable
+        JSONL requests.
+
+    solver : EntropySolver
+
+    batch : int
+
+    Yields
+    ------
+    response : dict
+        The request 'id' (if any) with 'guess', 'score' and 'candidates',
+        or with 'error' for malformed requests.
+
+    """
+
+    lines = iter(lines)
+    while True:
+        chunk = [line for line in islice(lines, batch) if line.strip()]
+        if not chunk:
+            return
+        responses, histories, positions = [None] * len(chunk), [], []
+        for i, line in enumerate(chunk):
+            # Responses echo the request id, including error responses
+            responses[i] = {}
+            try:
+                request = json.loads(line)
+                if isinstance(request, dict) and 'id' in request:
+                    responses[i]['id'] = request['id']
+                history = parse_request(request, solver.table)
+            except ValueError as error:
+                responses[i]['error'] = str(error)
+                continue
+            histories.append(history)
+            positions.append(i)
+        for i, suggestion in zip(positions, solver.suggest_many(histories)):
+            responses[i].update(suggestion)
+        yield from responses
+
+
+if __name__ == '__main__':
+    # python -m Solver.Stream [input.jsonl] [--output out.jsonl] [--batch B] [--hard-mode]
+    parser = argparse.ArgumentParser(description = 'Suggest next guesses for JSONL game histories.')
+    parser.add_argument('input', nargs = '?', default = '-', help = 'JSONL requests; stdin when omitted')
+    parser.add_argument('--output', default = '-', help = 'JSONL responses; stdout when omitted')
+    parser.add_argument('--batch', type = int, default = 10000, help = 'requests held in memory at once')
+    parser.add_argument('--hard-mode', action = 'store_true')
+    parser.add_argument('--length', type = int, default = 5)
+    args = parser.parse_args()
+    # Load tables once for the whole stream
+    Artifacts.ensure(('pattern_table', 'partition_index'), args.length)
+    table = PatternTable.load(args.length)
+    solver = EntropySolver(table, args.hard_mode, index = PartitionIndex.load(table))
+    source = sys.stdin if args.input == '-' else open(args.input)
+    sink = sys.stdout if args.output == '-' else open(args.output, 'w')
+    start, n = time.perf_counter(), 0
+    for response in solve(source, solver, args.batch):
+        sink.write(json.dumps(response) + '\n')
+        n += 1
+    sink.flush()
+    elapsed = time.perf_counter() - start
+    print('Answered {} requests in {:.2f} s ({:.0f} requests/s)'.format(n, elapsed, n / max(elapsed, 1e-9)), file = sys.stderr)